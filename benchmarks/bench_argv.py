@@ -0,0 +1,64 @@
+"""
+Benchmark command line parsing of `Config` with large default configs.
+
+Compares the single-pass :class:`~expfig.core._argv.ArgvEngine` with the previous argparse path, which parsed the
+command line three times: once for ``--config``, once for values and once more to track sources.
+
+Run with ``python -m benchmarks.bench_argv``.
+"""
+import argparse
+import timeit
+
+from expfig.core._argv import ArgvEngine
+from expfig.core._parse import ListType, ListAction
+from expfig.core._schema import ArgumentSchema
+
+
+def make_default(n_leaves, width=10):
+    default = {}
+    for j in range(n_leaves):
+        default.setdefault(f'group_{j // width}', {})[f'value_{j % width}'] = float(j)
+
+    return default
+
+
+def make_argv(n_leaves, n_passed, width=10):
+    argv = ['--config', 'a.yaml', 'b.yaml']
+    for j in range(0, n_leaves, max(n_leaves // n_passed, 1)):
+        argv.extend([f'--group_{j // width}.value_{j % width}', str(-j)])
+
+    return argv
+
+
+def argparse_path(schema, argv):
+    config_parser = argparse.ArgumentParser()
+    config_parser.add_argument('--config', default=[], nargs='+', type=ListType.from_type(str), action=ListAction)
+    config_args, other_args = argv[:3], argv[3:]
+    config_parser.parse_args(config_args)
+
+    parsed = schema.parser.parse_known_args(other_args, namespace=argparse.Namespace())
+    passed = schema.parser.parse_known_args(other_args)
+
+    return parsed, passed
+
+
+def engine_path(schema, argv):
+    return ArgvEngine(schema).parse(argv)
+
+
+def main(sizes=(100, 1000, 3000), n_passed=50, number=20):
+    print(f'{"leaves":>8} {"argparse (ms)":>14} {"engine (ms)":>12} {"speedup":>8}')
+
+    for n_leaves in sizes:
+        schema = ArgumentSchema.from_default(make_default(n_leaves))
+        _ = schema.parser
+        argv = make_argv(n_leaves, n_passed)
+
+        t_argparse = timeit.timeit(lambda: argparse_path(schema, argv), number=number) / number
+        t_engine = timeit.timeit(lambda: engine_path(schema, argv), number=number) / number
+
+        print(f'{n_leaves:>8} {1e3 * t_argparse:>14.3f} {1e3 * t_engine:>12.3f} {t_argparse / t_engine:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
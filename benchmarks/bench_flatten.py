@@ -0,0 +1,90 @@
+"""
+Benchmark :func:`~expfig.core.unflatten` and :func:`~expfig.core.flatten` on large flat dicts.
+
+Compares the iterative implementations against the previous recursive implementations, which built a one-key nested
+dict per key and merged it into the output with :func:`~expfig.core.nested_dict_update`.
+
+Run with ``python -m benchmarks.bench_flatten``.
+"""
+import timeit
+
+from expfig.core import flatten, unflatten, nested_dict_update
+from expfig.utils import api
+
+
+def make_flat(n_keys, width=10):
+    depth = max(len(str(n_keys - 1)), 2)
+
+    flat = {}
+    for j in range(n_keys):
+        keys = [f'level_{i}_{(j // width ** (depth - 1 - i)) % width}' for i in range(depth - 1)]
+        flat['.'.join([*keys, f'value_{j % width}'])] = float(j)
+
+    return flat
+
+
+def recursive_unflatten(arguments, delimiter='.'):
+    if set(arguments.keys()) == {''}:
+        return arguments['']
+
+    restructured = {}
+    for key, value in arguments.items():
+        top_key, _, bottom_keys = key.partition(delimiter)
+        nested_dict_update(restructured, {top_key: recursive_unflatten({bottom_keys: value})})
+
+    return restructured
+
+
+def recursive_flatten(nested, delimiter='.', levels=None, _key_stack=()):
+    if levels is None:
+        levels = recursive_depth(nested) + 1
+
+    flat = {}
+    for k, v in nested.items():
+        if api.is_dict_like(v) and (
+            (levels >= 0 and len(_key_stack) < levels - 1) or
+            (levels < 0 and recursive_depth(v) > -1 * levels)
+        ):
+            flat.update(recursive_flatten(v, delimiter, levels=levels, _key_stack=[*_key_stack, k]))
+        else:
+            flat[delimiter.join([*_key_stack, k])] = v
+
+    return flat
+
+
+def recursive_depth(d):
+    if api.is_dict_like(d):
+        return 1 + (max(map(recursive_depth, d.values())) if d else 0)
+    return 0
+
+
+CASES = {
+    'unflatten': (recursive_unflatten, unflatten, lambda flat: (flat, )),
+    'flatten': (recursive_flatten, flatten, lambda flat: (unflatten(flat), )),
+    'flatten(levels=-1)': (
+        lambda nested: recursive_flatten(nested, levels=-1),
+        lambda nested: flatten(nested, levels=-1),
+        lambda flat: (unflatten(flat), )
+    ),
+}
+
+
+def main(sizes=(1000, 10000, 100000, 1000000), number=3):
+    print(f'{"keys":>8} {"function":>20} {"recursive (ms)":>15} {"iterative (ms)":>15} {"speedup":>8}')
+
+    for n_keys in sizes:
+        flat = make_flat(n_keys)
+        n = number if n_keys < 1000000 else 1
+
+        for name, (recursive, iterative, make_args) in CASES.items():
+            args = make_args(flat)
+
+            t_recursive = timeit.timeit(lambda: recursive(*args), number=n) / n
+            t_iterative = timeit.timeit(lambda: iterative(*args), number=n) / n
+
+            print(f'{n_keys:>8} {name:>20} {1e3 * t_recursive:>15.3f} {1e3 * t_iterative:>15.3f} '
+                  f'{t_recursive / t_iterative:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
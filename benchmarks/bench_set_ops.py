@@ -0,0 +1,59 @@
+"""
+Benchmark :class:`~expfig.namespacify.Namespacify` set operations on large configs that differ in a few keys.
+
+Compares set operations that compare subtrees with cached digests against full comparisons of every subtree (the
+previous behaviour), for both the first operation (digests are computed) and repeated operations (digests are cached).
+
+Run with ``python -m benchmarks.bench_set_ops``.
+"""
+import timeit
+
+from unittest import mock
+
+from expfig import namespacify
+from expfig.namespacify import Namespacify
+
+
+def make_config(n_leaves, width=10, n_differ=0):
+    config = {}
+    for j in range(n_leaves):
+        node = config.setdefault(f'group_{j // width ** 2}', {}).setdefault(f'subgroup_{(j // width) % width}', {})
+        node[f'value_{j % width}'] = float(j)
+
+    for j in range(0, n_leaves, max(n_leaves // n_differ, 1) if n_differ else n_leaves + 1):
+        node = config[f'group_{j // width ** 2}'][f'subgroup_{(j // width) % width}']
+        node[f'value_{j % width}'] = -1.0
+
+    return Namespacify(config)
+
+
+OPS = {
+    'difference': lambda a, b: a - b,
+    'symmetric_difference': lambda a, b: a ^ b,
+    'intersection': lambda a, b: a & b,
+}
+
+
+def full_comparison(a, b, atol=0.0, rtol=0.0):
+    return namespacify.equal(a, b, atol=atol, rtol=rtol)
+
+
+def main(sizes=(1000, 10000), n_differ=5, number=10):
+    print(f'{"leaves":>8} {"operation":>22} {"full (ms)":>10} {"first (ms)":>11} {"cached (ms)":>12} {"speedup":>8}')
+
+    for n_leaves in sizes:
+        for op_name, op in OPS.items():
+            a, b = make_config(n_leaves), make_config(n_leaves, n_differ=n_differ)
+
+            with mock.patch.object(namespacify, '_equal_values', full_comparison):
+                t_full = timeit.timeit(lambda: op(a, b), number=number) / number
+
+            t_first = timeit.timeit(lambda: op(a, b), number=1)
+            t_cached = timeit.timeit(lambda: op(a, b), number=number) / number
+
+            print(f'{n_leaves:>8} {op_name:>22} {1e3 * t_full:>10.3f} {1e3 * t_first:>11.3f} '
+                  f'{1e3 * t_cached:>12.3f} {t_full / t_cached:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
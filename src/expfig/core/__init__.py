@@ -2,3 +2,6 @@ from ._flatten import depth, unflatten, flatten, nested_dict_update
 from ._str_types import str2bool, str2none, none2any, TypeToNone
 from .similar_args import get_similar_args_str_fmt
 from ._parse import get_type
+from ._schema import schema_cache_info, clear_schema_cache
+from ._patch import Patch
+from ._array import ArrayRef
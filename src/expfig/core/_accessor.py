@@ -0,0 +1,162 @@
+import keyword
+import threading
+
+from collections import UserDict
+
+
+class Accessor:
+    """
+    Base class of generated ``__slots__`` accessor classes.
+
+    Accessor classes are generated by :func:`accessor_class` from the structure of a nested dict-like object. Every
+    key that is a valid attribute name becomes a slot; nested dict-like values become instances of nested accessor
+    classes. Reading a value is plain attribute access, without the ``__getattr__`` and ``__getitem__`` overhead of
+    :class:`.Namespacify`.
+
+    Keys that cannot be attributes (e.g. non-identifiers, keywords or names of accessor methods) are kept in the
+    ``_extra`` dict so that conversion back to a dict is lossless.
+    """
+    __slots__ = ('_extra', )
+
+    _fields = ()
+    _field_set = frozenset()
+    _children = {}
+
+    @classmethod
+    def from_dict(cls, d):
+        """
+        Create an accessor instance from a nested dict-like object with the structure of the accessor class.
+        """
+        inst = cls.__new__(cls)
+        extra = {}
+
+        for key, value in d.items():
+            child_cls = cls._children.get(key)
+            if child_cls is not None and isinstance(value, (dict, UserDict)):
+                value = child_cls.from_dict(value)
+
+            if key in cls._field_set:
+                object.__setattr__(inst, key, value)
+            else:
+                extra[key] = value
+
+        object.__setattr__(inst, '_extra', extra)
+        return inst
+
+    @classmethod
+    def from_namespacify(cls, namespacify):
+        return cls.from_dict(namespacify)
+
+    def to_dict(self):
+        d = {}
+        for key in self._fields:
+            try:
+                value = object.__getattribute__(self, key)
+            except AttributeError:
+                continue
+
+            d[key] = value.to_dict() if isinstance(value, Accessor) else value
+
+        for key, value in self._extra.items():
+            d[key] = value.to_dict() if isinstance(value, Accessor) else value
+
+        return d
+
+    def to_namespacify(self):
+        from expfig import Namespacify  # prevent circular import
+        return Namespacify(self.to_dict())
+
+    def __eq__(self, other):
+        if not isinstance(other, Accessor):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+
+_accessor_classes = {}
+_accessor_lock = threading.Lock()
+
+
+def accessor_class(template, name='Config'):
+    """
+    Get the (cached) accessor class corresponding to the structure of `template`.
+
+    Classes are cached process-wide and keyed by the keys and leaf types of `template`, so all objects with the same
+    structure share one class.
+
+    Parameters
+    ----------
+    template : dict-like
+        Nested dict-like object to generate the class from.
+    name : str, default 'Config'
+        Prefix of the name of the generated (root) class.
+
+    Returns
+    -------
+    cls : type
+        Subclass of :class:`Accessor`.
+
+    """
+    key = (name, _structure_key(template))
+
+    with _accessor_lock:
+        try:
+            return _accessor_classes[key]
+        except KeyError:
+            pass
+
+    cls = _make_accessor_class(template, name)
+
+    with _accessor_lock:
+        return _accessor_classes.setdefault(key, cls)
+
+
+def _structure_key(d):
+    return tuple(
+        (k, _structure_key(v) if isinstance(v, (dict, UserDict)) and len(v) else type(v))
+        for k, v in d.items()
+    )
+
+
+def _make_accessor_class(template, name):
+    fields = []
+    children = {}
+    annotations = {}
+
+    for key, value in template.items():
+        if isinstance(value, (dict, UserDict)) and len(value):
+            child_name = name + (_camel_case(key) if _is_attribute_name(key) else str(len(children)))
+            children[key] = _make_accessor_class(value, child_name)
+            annotation = children[key]
+        else:
+            annotation = type(value)
+
+        if _is_attribute_name(key):
+            fields.append(key)
+            annotations[key] = annotation
+
+    namespace = {
+        '__slots__': tuple(fields),
+        '__annotations__': annotations,
+        '_fields': tuple(fields),
+        '_field_set': frozenset(fields),
+        '_children': children,
+    }
+
+    return type(f'{name}Accessor', (Accessor, ), namespace)
+
+
+def _is_attribute_name(key):
+    return (
+        isinstance(key, str) and
+        key.isidentifier() and
+        not keyword.iskeyword(key) and
+        not hasattr(Accessor, key)
+    )
+
+
+def _camel_case(key):
+    return ''.join(part[:1].upper() + part[1:] for part in key.split('_'))
@@ -0,0 +1,155 @@
+import argparse
+import re
+
+from collections import namedtuple
+
+from expfig.core._parse import ListType
+
+
+ParsedArgv = namedtuple('ParsedArgv', ['config_files', 'values', 'unrecognized'])
+
+CONFIG_FILE_TYPE = ListType.from_type(str)
+VERBOSE_TYPE = int
+
+_NEGATIVE_NUMBER = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+
+class ArgvEngine:
+    """
+    Single-pass, exact-match command line parser for an :class:`~expfig.core._schema.ArgumentSchema`.
+
+    Walks the command line once and collects ``--config`` files, typed argument values and the source of each passed
+    argument. Unlike argparse, option names are matched exactly (abbreviations are not expanded), which keeps each
+    lookup a single dict access regardless of the number of options.
+
+    Type conversion, ``nargs='+'`` collection and error messages follow argparse, and errors are reported through
+    the argparse parser of the schema (exiting with status 2).
+
+    Parameters
+    ----------
+    schema : :class:`~expfig.core._schema.ArgumentSchema`
+        Schema to parse arguments against.
+
+    """
+    def __init__(self, schema):
+        self.schema = schema
+
+    def parse(self, argv):
+        """
+        Parse command line arguments.
+
+        Parameters
+        ----------
+        argv : list of str
+            Command line arguments, excluding the program name.
+
+        Returns
+        -------
+        parsed : ParsedArgv
+            Named tuple with fields:
+            * ``config_files``: list of config files passed with ``--config``.
+            * ``values``: dict of typed values of passed arguments, keyed by '.'-delimited argument name.
+            * ``unrecognized``: list of unrecognized command line tokens.
+
+        """
+        self._check_single_config_arg(argv)
+
+        config_files = []
+        values = {}
+        unrecognized = []
+
+        j = 0
+        while j < len(argv):
+            token = argv[j]
+            end = j + 1
+
+            if not _is_option(token):
+                unrecognized.append(token)
+                j = end
+                continue
+
+            while end < len(argv) and not _is_option(argv[end]):
+                end += 1
+
+            if token in ('-h', '--help'):
+                self.schema.parser.parse_args(['--help'])
+
+            name, has_inline, inline_value = token.lstrip('-').partition('=')
+            tokens = [inline_value] if has_inline else argv[j+1:end]
+
+            if not token.startswith('--'):
+                unrecognized.extend(argv[j:end])
+            elif name == 'config':
+                config_files = self._convert(name, tokens, CONFIG_FILE_TYPE, nargs='+')
+                unrecognized.extend(argv[j+1:end] if has_inline else [])
+            elif name in self.schema.arguments:
+                _type, additional_args = self.schema.arguments[name]
+                nargs = additional_args.get('nargs')
+
+                values[name] = self._convert(name, tokens, _type, nargs=nargs)
+
+                if has_inline:
+                    unrecognized.extend(argv[j+1:end])
+                elif nargs is None:
+                    unrecognized.extend(argv[j+2:end])
+            elif name == 'verbose':
+                values[name] = self._convert(name, tokens, VERBOSE_TYPE)
+                unrecognized.extend(argv[j+1:end] if has_inline else argv[j+2:end])
+            else:
+                unrecognized.extend(argv[j:end])
+
+            j = end
+
+        return ParsedArgv(config_files, values, unrecognized)
+
+    def _convert(self, name, tokens, _type, nargs=None):
+        if nargs is None:
+            if not tokens:
+                self._error(f'argument --{name}: expected one argument')
+
+            return self._get_value(name, tokens[0], _type)
+
+        if not tokens:
+            self._error(f'argument --{name}: expected at least one argument')
+        elif getattr(_type, 'vectorized', False):
+            return self._get_value(name, tokens, _type)
+
+        values = [self._get_value(name, token, _type) for token in tokens]
+
+        if len(values) == 1 and isinstance(values[0], list) and _type.type != list:
+            values = values[0]
+
+        return values
+
+    def _get_value(self, name, token, _type):
+        try:
+            return _type(token)
+        except argparse.ArgumentTypeError as e:
+            msg = str(e)
+        except (TypeError, ValueError):
+            type_name = getattr(_type, '__name__', repr(_type))
+            msg = f'invalid {type_name} value: {token!r}'
+
+        self._error(f'argument --{name}: {msg}')
+
+    def _error(self, msg):
+        self.schema.parser.error(msg)
+
+    @staticmethod
+    def _check_single_config_arg(argv):
+        if sum(x.startswith('--config') for x in argv) > 1:
+            msg = "Multiple --config arguments encountered. Pass multiple configs with a single --config prefix, e.g. " \
+                  "'python script.py --config config_1.yaml config_2.yaml'"
+            raise TypeError(msg)
+
+
+def _is_option(token):
+    # Mirrors argparse: negative numbers and strings containing spaces are values, not options.
+    if len(token) < 2 or not token.startswith('-'):
+        return False
+    elif _NEGATIVE_NUMBER.match(token):
+        return False
+    elif ' ' in token and '=' not in token:
+        return False
+
+    return True
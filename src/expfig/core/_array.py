@@ -0,0 +1,169 @@
+import base64
+import numpy as np
+import threading
+import yaml
+
+from pathlib import Path
+
+
+NDARRAY_TAG = '!ndarray'
+
+# Arrays with at most this many elements are serialized as a readable list of values, larger arrays as base64 data.
+MAX_LISTED_ELEMENTS = 64
+
+NUMERIC_KINDS = 'biufc'
+
+
+def is_numeric_array(value):
+    return isinstance(value, np.ndarray) and value.dtype.kind in NUMERIC_KINDS
+
+
+def represent_ndarray(dumper, arr):
+    """
+    Represent a numpy array as a compact ``!ndarray`` mapping.
+
+    Numeric arrays are represented by their dtype, shape and either their values (small arrays) or their raw bytes
+    in base64 (large arrays). Other arrays are represented as nested lists.
+    """
+    if not is_numeric_array(arr):
+        return dumper.represent_list(arr.tolist())
+
+    if arr.size <= MAX_LISTED_ELEMENTS:
+        contents = ('values', arr.ravel().tolist())
+    else:
+        contents = ('data', base64.b64encode(np.ascontiguousarray(arr).tobytes()).decode('ascii'))
+
+    # A list of pairs keeps the keys in this order
+    mapping = [('dtype', arr.dtype.str), ('shape', list(arr.shape)), contents]
+    return dumper.represent_mapping(NDARRAY_TAG, mapping, flow_style=True)
+
+
+def represent_numpy_scalar(dumper, value):
+    """
+    Represent a numpy scalar as the equivalent Python scalar.
+    """
+    return dumper.represent_data(value.item())
+
+
+def construct_ndarray(loader, node):
+    mapping = loader.construct_mapping(node, deep=True)
+    dtype, shape = np.dtype(mapping['dtype']), tuple(mapping['shape'])
+
+    if 'data' in mapping:
+        arr = np.frombuffer(base64.b64decode(mapping['data']), dtype=dtype).copy()
+    else:
+        arr = np.array(mapping['values'], dtype=dtype)
+
+    return arr.reshape(shape)
+
+
+class ArrayRef(yaml.YAMLObject):
+    """
+    Reference to an array stored in a ``.npy`` file, e.g. a large lookup table in a config.
+
+    Written in yaml as ``!array path/to/array.npy``. The file is only opened on first access of :attr:`array`, as a
+    read-only memory map, so the array is never read into memory as a whole. References are immutable: copies
+    (including deep copies, e.g. of configs that contain them) are the reference itself and share the memory map.
+    A reference is serialized as its path, never as its data.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path of the ``.npy`` file. Relative paths are relative to the working directory at the time the file is
+        opened. When loaded from a yaml file, relative paths are resolved against the directory of that file instead.
+
+    Examples
+    --------
+    >>> ref = load_yaml('weights: !array class_weights.npy')['weights']
+    >>> ref.shape
+    (1000000, )
+    >>> ref[:3]
+    memmap([0.5, 1. , 2. ])
+
+    """
+    yaml_tag = '!array'
+    yaml_loader = yaml.SafeLoader
+    yaml_dumper = yaml.SafeDumper
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._array = None
+        self._lock = threading.Lock()
+
+    @property
+    def array(self):
+        """
+        Read-only memory map of the referenced array.
+        """
+        if self._array is None:
+            with self._lock:
+                if self._array is None:
+                    self._array = np.load(self.path, mmap_mode='r', allow_pickle=False)
+
+        return self._array
+
+    @property
+    def shape(self):
+        return self.array.shape
+
+    @property
+    def dtype(self):
+        return self.array.dtype
+
+    @classmethod
+    def from_yaml(cls, loader, node):
+        path = loader.construct_scalar(node)
+        source_dir = getattr(loader, 'source_dir', None)
+
+        if source_dir is not None:
+            path = source_dir / Path(path).expanduser()
+
+        return cls(path)
+
+    @classmethod
+    def to_yaml(cls, dumper, data):
+        return dumper.represent_scalar(cls.yaml_tag, data.path)
+
+    def to_dict(self):
+        return {'path': self.path}
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == self.dtype:
+            return self.array.copy() if copy else self.array
+        elif copy is False:
+            raise ValueError(f'Unable to avoid a copy while casting {self!r} from {self.dtype} to {np.dtype(dtype)}.')
+
+        return self.array.astype(dtype)
+
+    def __getitem__(self, item):
+        return self.array[item]
+
+    def __len__(self):
+        return len(self.array)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self.path == other.path or Path(self.path).resolve() == Path(other.path).resolve()
+
+    def __hash__(self):
+        return hash(Path(self.path).resolve())
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.path!r})'
+
+
+yaml.SafeLoader.add_constructor(NDARRAY_TAG, construct_ndarray)
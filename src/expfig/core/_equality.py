@@ -0,0 +1,164 @@
+import hashlib
+import numbers
+import threading
+import weakref
+
+import numpy as np
+
+
+_NUMERIC_KINDS = frozenset('biufc')
+
+
+def equal(a, b, atol=0.0, rtol=0.0):
+    """
+    Compare two leaf values.
+
+    Numpy arrays are compared by shape and dtype before their values are compared, and are never compared through a
+    temporary boolean array if their contents can be ruled equal or unequal otherwise. Digests of arrays backed by
+    immutable buffers (e.g. bytes or read-only memory maps) are cached, so repeatedly comparing the same such arrays
+    only compares their values once.
+
+    Parameters
+    ----------
+    a, b : object
+        Values to compare.
+    atol, rtol : float, default 0.0
+        Absolute and relative tolerance of the comparison of numbers and numeric arrays, as in :func:`numpy.isclose`:
+        ``a`` and ``b`` are equal if ``abs(a - b) <= atol + rtol * abs(b)``. Other values are compared exactly.
+        NaN is never equal to anything.
+
+    Returns
+    -------
+    equal : bool
+
+    """
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return _array_equal(a, b, atol, rtol)
+    elif (atol or rtol) and _is_real(a) and _is_real(b):
+        return bool(a == b or abs(a - b) <= atol + rtol * abs(b))
+    elif a is b and not (isinstance(a, (float, complex, np.inexact)) and a != a):
+        return True
+
+    try:
+        return bool(a == b)
+    except ValueError:
+        return np.array_equal(a, b)
+
+
+def _is_real(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def _array_equal(a, b, atol, rtol):
+    if not (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)):
+        a, b = np.asanyarray(a), np.asanyarray(b)
+
+    if a.shape != b.shape:
+        return False
+
+    kind_a, kind_b = a.dtype.kind, b.dtype.kind
+    numeric = kind_a in _NUMERIC_KINDS and kind_b in _NUMERIC_KINDS
+
+    if kind_a != kind_b and not numeric:
+        return np.array_equal(a, b) if 'O' in (kind_a, kind_b) else False
+
+    inexact = kind_a in 'fc' or kind_b in 'fc'
+
+    if a.dtype == b.dtype and kind_a != 'O':
+        if a is b and not inexact:
+            return True
+
+        digest_a, digest_b = _array_digest(a), _array_digest(b)
+        if digest_a is not None and digest_b is not None:
+            if digest_a == digest_b:
+                # Equal bytes are equal values, unless NaN (excluded from digests)
+                return True
+            elif not inexact:
+                return False
+
+    if numeric and (atol or rtol):
+        return bool(np.allclose(a, b, atol=atol, rtol=rtol))
+
+    return np.array_equal(a, b)
+
+
+class _ArrayDigests:
+    def __init__(self):
+        self._digests = {}
+        self._lock = threading.Lock()
+
+    def get(self, arr):
+        key = id(arr)
+
+        with self._lock:
+            try:
+                ref, digest = self._digests[key]
+            except KeyError:
+                pass
+            else:
+                if ref() is arr:
+                    return digest
+
+        digest = _compute_array_digest(arr)
+
+        try:
+            ref = weakref.ref(arr, lambda _, key=key: self._discard(key))
+        except TypeError:
+            return digest
+
+        with self._lock:
+            self._digests[key] = (ref, digest)
+
+        return digest
+
+    def _discard(self, key):
+        with self._lock:
+            entry = self._digests.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._digests[key]
+
+    def __len__(self):
+        return len(self._digests)
+
+
+_array_digests = _ArrayDigests()
+
+
+def _array_digest(arr):
+    if arr.flags.writeable or arr.dtype.kind == 'O':
+        return None
+    elif not _has_immutable_buffer(arr):
+        return _compute_array_digest(arr)
+
+    return _array_digests.get(arr)
+
+
+def _has_immutable_buffer(arr):
+    """
+    Whether the data of `arr` cannot change, i.e. whether it may be shared instead of copied and its digest cached.
+
+    The ``writeable`` flag of an array that owns its data (or of a view of such an array) can be set back to True, so
+    only arrays backed by a read-only buffer, such as bytes or a memory map opened in mode 'r', cannot change.
+    """
+    base = arr
+    while isinstance(base, np.ndarray):
+        if base.base is None:
+            return False
+
+        base = base.base
+
+    try:
+        return memoryview(base).readonly
+    except TypeError:
+        return False
+
+
+def _compute_array_digest(arr):
+    if arr.dtype.kind in 'fc' and np.isnan(arr).any():
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str((arr.dtype.str, arr.shape)).encode())
+    digest.update(np.ascontiguousarray(arr).data)
+
+    return digest.digest()
@@ -4,49 +4,121 @@ from warnings import warn
 from expfig.utils import api
 
 
+_LEAF_TYPES = frozenset((bool, int, float, str, type(None)))
+
+
 def unflatten(arguments, delimiter='.'):
+    """
+    Nest a flat dict of `delimiter`-delimited keys.
+
+    Each key is inserted directly into the output, creating intermediate dicts as needed. A leaf is replaced by a dict
+    if a later key nests below it, and dict values are merged with any dict already at their key
+    (see :func:`nested_dict_update`).
+    """
     if set(arguments.keys()) == {''}:
         return arguments['']
 
     restructured = {}
     for key, value in arguments.items():
-        top_key, _, bottom_keys = key.partition(delimiter)
-        update_with = {top_key: unflatten({bottom_keys: value})}
-        nested_dict_update(restructured, update_with)
+        keys = key.split(delimiter)
+        if len(keys) > 1 and not keys[-1]:
+            keys.pop()  # 'a.' is equivalent to 'a'
+
+        node = restructured
+        for k in keys[:-1]:
+            child = node.get(k)
+            if child is None or not _is_dict_like(child):
+                child = node[k] = {}
+
+            node = child
+
+        k = keys[-1]
+        if isinstance(value, (dict, UserDict)) and k in node and _is_dict_like(node[k]):
+            nested_dict_update(node[k], value)
+        else:
+            node[k] = value
 
     return restructured
 
 
-def flatten(nested, delimiter='.', levels=None, *, _key_stack=()):
+def flatten(nested, delimiter='.', levels=None):
+    depths = {}
+    return _flatten(nested, delimiter, levels, lambda d: _depth(d, depths))
+
+
+def _flatten(nested, delimiter, levels, node_depth):
+    """
+    Flatten `nested` in a single pass.
+
+    `node_depth` returns the depth of a dict-like node and should be memoized; with negative `levels` it is called on
+    every dict-like node.
+    """
     if levels is None:
-        levels = depth(nested) + 1
+        levels = float('inf')  # flatten all levels, without computing the depth of `nested`
 
     flat = {}
-    for k, v in nested.items():
-        if api.is_dict_like(v) and (
-            (levels >= 0 and len(_key_stack) < levels - 1) or
-            (levels < 0 and depth(v) > -1 * levels)
-        ):
-            flat.update(flatten(v, delimiter, levels=levels, _key_stack=[*_key_stack, k]))
+    _flatten_into(flat, nested, delimiter, levels, node_depth)
+    return flat
+
+
+def _flatten_into(flat, nested, delimiter, levels, node_depth):
+    # Each stack entry holds an iterator over the items of a node and the flat key prefix of its children
+    stack = [(iter(nested.items()), '')]
+
+    while stack:
+        items, prefix = stack[-1]
+
+        for k, v in items:
+            if not isinstance(k, str):
+                k = _cast_key(k, prefix)
+
+            if _is_dict_like(v) and (
+                (levels >= 0 and len(stack) < levels) or
+                (levels < 0 and node_depth(v) > -1 * levels)
+            ):
+                stack.append((iter(v.items()), f'{prefix}{k}{delimiter}'))
+                break
+
+            flat[prefix + k] = v
         else:
-            try:
-                flat_key = delimiter.join([*_key_stack, k])
-            except TypeError:
-                flat_key = delimiter.join([*_key_stack, str(k)])
-                warn(
-                    f"Flattening key ({k}) of type ({k.__class__.__name__}) at location '{flat_key}', "
-                    f"will be cast to str."
-                )
+            stack.pop()
 
-            flat[flat_key] = v
 
-    return flat
+def _cast_key(k, prefix):
+    cast = str(k)
+    warn(
+        f"Flattening key ({k}) of type ({k.__class__.__name__}) at location '{prefix}{cast}', will be cast to str."
+    )
+    return cast
+
+
+def _is_dict_like(value):
+    return isinstance(value, (dict, UserDict)) or (type(value) not in _LEAF_TYPES and api.is_dict_like(value))
 
 
 def depth(d):
-    if api.is_dict_like(d):
-        return 1 + (max(map(depth, d.values())) if d else 0)
-    return 0
+    return _depth(d, {})
+
+
+def _depth(d, memo):
+    if not _is_dict_like(d):
+        return 0
+
+    # Iterative post-order traversal: a node's depth is computed once the depths of all of its children are known
+    stack = [(d, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if id(node) in memo:
+            continue
+
+        if children_done:
+            memo[id(node)] = 1 + max((memo[id(v)] for v in node.values() if _is_dict_like(v)), default=0)
+            continue
+
+        stack.append((node, True))
+        stack.extend((v, False) for v in node.values() if _is_dict_like(v) and id(v) not in memo)
+
+    return memo[id(d)]
 
 
 def nested_dict_update(nested_dict, *args, nest_namespacify=False, **kwargs):
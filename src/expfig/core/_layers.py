@@ -0,0 +1,118 @@
+from collections import UserDict
+
+
+class ConfigLayers:
+    """
+    Nested, ChainMap-style stack of config layers.
+
+    Each layer is a (nested) dict-like object pushed together with its source, e.g. ``'DEFAULT'``, the path of a
+    config file or ``'ARGV'``. Layers are never copied or modified; values are resolved on read through the stack,
+    from the top (most recently pushed) layer down:
+
+    * A leaf in a layer shadows the values of all layers below it at the same key, including entire subtrees.
+    * Nested dict-like values are merged key by key across layers, as with successive calls to
+      :func:`~expfig.core.nested_dict_update`.
+
+    The layer that supplied each resolved leaf is the source of that leaf.
+
+    Examples
+    --------
+    >>> layers = ConfigLayers()
+    >>> layers.push('DEFAULT', {'truck': {'wheels': 4, 'brand': 'toyota'}})
+    >>> layers.push('ARGV', {'truck': {'brand': 'honda'}})
+    >>> layers.leaves()
+    {'truck.wheels': 4, 'truck.brand': 'honda'}
+    >>> layers.sources()
+    {'truck': {'wheels': 'DEFAULT', 'brand': 'ARGV'}}
+
+    """
+    def __init__(self):
+        self._layers = []
+
+    def push(self, source, layer):
+        """
+        Push a layer on top of the stack.
+
+        Parameters
+        ----------
+        source : object
+            Source of the values in `layer`.
+        layer : dict-like
+            Nested dict-like object. Kept by reference; it must not be modified while the stack is in use.
+
+        """
+        self._layers.append((source, layer))
+
+    def leaves(self, delimiter='.'):
+        """
+        Resolved leaves of the stack.
+
+        Returns
+        -------
+        leaves : dict
+            Mapping of each `delimiter`-delimited leaf key to its resolved value. Empty dict-like values are leaves.
+
+        """
+        return {delimiter.join(path): value for path, value, _ in self._walk(self._layers, ())}
+
+    def sources(self):
+        """
+        Source of each resolved leaf of the stack.
+
+        Returns
+        -------
+        sources : dict
+            Nested dict with the structure of the resolved stack, mapping each leaf to the source of the layer that
+            supplied it.
+
+        """
+        sources = {}
+        for path, _, source in self._walk(self._layers, ()):
+            node = sources
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+
+            node[path[-1]] = source
+
+        return sources
+
+    def clear(self):
+        self._layers.clear()
+
+    def _walk(self, layers, prefix):
+        keys = {}
+        for _, layer in layers:
+            keys.update(dict.fromkeys(layer))
+
+        for key in keys:
+            path = (*prefix, key)
+            present = [(source, layer[key]) for source, layer in layers if key in layer]
+            source, value = present[-1]
+
+            if not _is_branch(value):
+                yield path, value, source
+                continue
+
+            branches = []
+            for below in reversed(present):
+                if not _is_branch(below[1]):
+                    break  # shadowed by a leaf
+                branches.append(below)
+
+            emitted = False
+            for leaf in self._walk(branches[::-1], path):
+                emitted = True
+                yield leaf
+
+            if not emitted:
+                yield path, value, source
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __iter__(self):
+        return iter(self._layers)
+
+
+def _is_branch(value):
+    return isinstance(value, (dict, UserDict))
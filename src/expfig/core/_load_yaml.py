@@ -0,0 +1,147 @@
+import datetime
+import numpy as np
+import threading
+import yaml
+
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+
+from expfig.core._array import represent_ndarray, represent_numpy_scalar
+
+
+IMMUTABLE_TYPES = (str, int, float, bool, complex, bytes, type(None), datetime.date)
+
+
+class SafeLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+    """
+    Safe yaml loader backed by libyaml when available, falling back to the pure-Python :class:`yaml.SafeLoader`.
+
+    Constructors and resolvers are looked up on :class:`yaml.SafeLoader` at load time, so tags registered there
+    (e.g. by `YAMLObject` subclasses with ``yaml_loader = yaml.SafeLoader``) are recognized by this loader as well.
+
+    If `stream` is a file, its directory is available to constructors as :attr:`source_dir` (None otherwise).
+    """
+    def __init__(self, stream):
+        super().__init__(stream)
+
+        name = getattr(stream, 'name', None)
+        self.source_dir = Path(name).resolve().parent if isinstance(name, str) else None
+
+        self.yaml_constructors = yaml.SafeLoader.yaml_constructors
+        self.yaml_multi_constructors = yaml.SafeLoader.yaml_multi_constructors
+        self.yaml_implicit_resolvers = yaml.SafeLoader.yaml_implicit_resolvers
+
+
+def load_yaml(stream):
+    """
+    Drop-in replacement for :func:`yaml.safe_load` that uses libyaml when available.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+class SafeDumper(yaml.SafeDumper):
+    """
+    Safe yaml dumper that additionally represents numpy arrays as compact ``!ndarray`` mappings and numpy scalars as
+    the equivalent Python scalars.
+
+    Representers are looked up on :class:`yaml.SafeDumper` at dump time, so types registered there (e.g. by
+    `YAMLObject` subclasses with ``yaml_dumper = yaml.SafeDumper``) are represented by this dumper as well.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.yaml_representers = yaml.SafeDumper.yaml_representers
+        self.yaml_multi_representers = {
+            **yaml.SafeDumper.yaml_multi_representers,
+            np.ndarray: represent_ndarray,
+            np.bool_: represent_numpy_scalar,
+            np.number: represent_numpy_scalar
+        }
+
+
+def dump_yaml(data, stream=None, **kwargs):
+    """
+    Drop-in replacement for :func:`yaml.safe_dump` that also serializes numpy arrays, see :class:`SafeDumper`.
+    """
+    return yaml.dump(data, stream=stream, Dumper=SafeDumper, **kwargs)
+
+
+class _DocumentCache:
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, file_path):
+        path = Path(file_path).expanduser().resolve()
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            try:
+                cached_version, document = self._documents[path]
+            except KeyError:
+                pass
+            else:
+                if cached_version == version:
+                    self._documents.move_to_end(path)
+                    return fresh_copy(document)
+
+        with path.open('r') as stream:
+            document = load_yaml(stream)
+
+        with self._lock:
+            self._documents[path] = (version, document)
+            self._documents.move_to_end(path)
+            if len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+
+        return fresh_copy(document)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+_document_cache = _DocumentCache()
+
+
+def load_yaml_file(file_path):
+    """
+    Load a yaml file, reusing the parsed document if the file has been loaded before.
+
+    Parsed documents are cached in-process, keyed by resolved path, and are reparsed if the modification time or
+    size of the file changes. Each call returns a fresh copy of the cached document: containers are copied and mutable
+    leaves (e.g. yaml objects) are deep-copied, while immutable leaves are shared.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path of the yaml file.
+
+    Returns
+    -------
+    document : object
+        Deserialized contents of the file.
+
+    """
+    return _document_cache.load(file_path)
+
+
+def clear_yaml_cache():
+    _document_cache.clear()
+
+
+def fresh_copy(obj):
+    """
+    Copy containers and mutable leaves of a deserialized yaml document, sharing immutable leaves.
+    """
+    if isinstance(obj, IMMUTABLE_TYPES):
+        return obj
+    elif type(obj) is dict:
+        return {k: fresh_copy(v) for k, v in obj.items()}
+    elif type(obj) is list:
+        return [fresh_copy(v) for v in obj]
+
+    return deepcopy(obj)
@@ -1,9 +1,11 @@
 import argparse
+import numpy as np
 
 from ast import literal_eval
 from warnings import warn
 
 from expfig.core import str2bool, str2none, none2any, TypeToNone
+from expfig.core._array import is_numeric_array
 from expfig.core._parse_yaml_obj import YamlType
 from expfig.utils import api
 
@@ -11,7 +13,10 @@ from expfig.utils import api
 def parse_arg_type(base_default, arg_name=None):
     additional_args = {}
 
-    if api.is_list_like(base_default):
+    if is_numeric_array(base_default):
+        additional_args.update(nargs='+')
+        _type = ArrayType.from_array(base_default)
+    elif api.is_list_like(base_default):
         additional_args.update(nargs='+', action=ListAction)
         _type = ListType.from_list(base_default, arg_name)
     elif getattr(base_default, 'yaml_tag', None) is not None:  # is a Yaml object
@@ -40,6 +45,10 @@ class ListType:
 
     def __call__(self, value):
         if isinstance(value, list):
+            literal = self._parse_numeric(value)
+            if literal is not None:
+                return literal
+
             literal = [self._type(v) for v in value]
         elif self._type.type == str:
             literal = self.str2none_eval(value)
@@ -52,6 +61,38 @@ class ListType:
 
         return self.type_check(literal)
 
+    def _parse_numeric(self, value):
+        """
+        Parse and validate a flat list of numbers (or numeric strings) in one vectorized step.
+
+        Returns None if `value` is not such a list, or if parsing it requires the element type, e.g. because it
+        contains None or nested lists; the caller then parses element by element.
+        """
+        _type = getattr(self._type, 'type', None)
+        if _type not in _VECTORIZED_KINDS or not value:
+            return None
+
+        try:
+            arr = np.array(value)
+        except ValueError:
+            return None
+
+        if arr.ndim != 1:
+            return None
+        elif arr.dtype.kind == 'U':
+            if np.isin(arr, _NONE_STRINGS).any():
+                return None
+
+            try:
+                arr = arr.astype(_type)
+            except (ValueError, OverflowError):
+                return None
+        elif arr.dtype.kind not in _VECTORIZED_KINDS[_type] or not np.can_cast(arr.dtype, _type, 'safe'):
+            # e.g. uint64 values above the int64 range, which the cast would wrap around
+            return None
+
+        return arr.astype(_type, copy=False).tolist()
+
     def type_check(self, value):
         if isinstance(value, list) and all(isinstance(v, self.valid_types) for v in value) or \
                 isinstance(value, self.valid_types):
@@ -77,7 +118,7 @@ class ListType:
 
     @classmethod
     def from_list(cls, list_like, arg_name=None):
-        unique_types = {parse_arg_type(x, None)[0] for x in list_like if x is not None}
+        unique_types = {parse_arg_type(x, None)[0] for x in element_representatives(list_like)}
 
         if len(unique_types) == 1:
             _type = unique_types.pop()
@@ -107,6 +148,142 @@ class ListType:
         return hash(self._type)
 
 
+# Element types parsed by ListType._parse_numeric, and the numpy dtype kinds that can be cast to them exactly as the
+# element type would cast each element. Floats are not cast to int, as int() truncates them.
+_VECTORIZED_KINDS = {int: 'biu', float: 'biuf'}
+_NONE_STRINGS = ('None', 'null')
+
+
+def element_representatives(list_like):
+    """
+    Elements of `list_like` that determine its list type, see :func:`parse_arg_type`.
+
+    Returns one element per distinct element type (and, for strings, whether the string is empty), and all
+    list-like elements. None is skipped. Equivalent to but much cheaper than inferring the type of every element of a
+    long, homogeneous list.
+    """
+    representatives = {}
+    nested = []
+
+    for _type in dict.fromkeys(map(type, list_like)):
+        if _type is type(None):
+            continue
+
+        elements = (x for x in list_like if type(x) is _type)
+
+        if issubclass(_type, str):
+            strings = {}
+            for x in elements:
+                strings.setdefault(x == '', x)
+                if len(strings) == 2:
+                    break
+
+            representatives.update(((_type, empty), x) for empty, x in strings.items())
+            continue
+
+        first = next(elements)
+        if api.is_list_like(first):
+            nested.extend((first, *elements))
+        else:
+            representatives[_type] = first
+
+    return [*representatives.values(), *nested]
+
+
+class ArrayType:
+    """
+    Type of numeric numpy array arguments, with the dtype and shape of the default array.
+
+    Converts a list of command line tokens, a (nested) list of values from a config file, or a reference
+    ``'@path.npy'`` to a ``.npy`` file to an array in a single vectorized step. The size of the first axis may differ
+    from the default; all other axes must match it. Flat values are reshaped accordingly.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        dtype of the array.
+    shape : tuple of int
+        Shape of the default array.
+
+    """
+    __name__ = 'ArrayType'
+    vectorized = True  # called once with all command line tokens, see ArgvEngine
+
+    def __init__(self, dtype, shape):
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_array(cls, arr):
+        return cls(arr.dtype, arr.shape)
+
+    def __call__(self, value):
+        if isinstance(value, list) and len(value) == 1 and isinstance(value[0], str):
+            value = value[0]  # a single command line token
+
+        if isinstance(value, str):
+            if value in _NONE_STRINGS:
+                return None
+
+            value = self._parse_str(value)
+        elif value is None:
+            return None
+
+        arr = np.asarray(value)
+
+        if arr.dtype.kind in 'US':
+            arr = arr.astype(self.dtype)
+        elif not np.can_cast(arr.dtype, self.dtype, casting='same_kind'):
+            raise argparse.ArgumentTypeError(f'Cannot cast array of dtype {arr.dtype} to dtype {self.dtype}.')
+        else:
+            arr = arr.astype(self.dtype, copy=False)
+
+        return self._reshape(arr)
+
+    def _parse_str(self, value):
+        if value.startswith('@'):
+            try:
+                return np.load(value[1:], allow_pickle=False)
+            except (OSError, ValueError) as e:
+                raise argparse.ArgumentTypeError(f"Unable to load array from '{value[1:]}': {e}")
+        elif value.startswith('['):
+            return literal_eval(value)
+
+        return [value]
+
+    def _reshape(self, arr):
+        if arr.ndim == 1 and len(self.shape) != 1:
+            try:
+                arr = arr.reshape((-1, *self.shape[1:]) if self.shape else ())
+            except ValueError:
+                raise argparse.ArgumentTypeError(f'Cannot reshape array of size {arr.size} to shape {self.shape}.')
+
+        if arr.shape[1:] != self.shape[1:] or arr.ndim != len(self.shape):
+            raise argparse.ArgumentTypeError(f'Invalid array shape {arr.shape}, expected shape {self.shape}.')
+
+        return arr
+
+    @property
+    def type(self):
+        return np.ndarray
+
+    @property
+    def valid_types(self):
+        return np.ndarray, type(None)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(dtype={self.dtype.str!r}, shape={self.shape})'
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self.dtype == other.dtype and self.shape[1:] == other.shape[1:] and len(self.shape) == len(other.shape)
+
+    def __hash__(self):
+        return hash((self.dtype, len(self.shape), self.shape[1:]))
+
+
 class ListAction(argparse._StoreAction):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
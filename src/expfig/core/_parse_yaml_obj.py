@@ -1,12 +1,19 @@
+import re
 import yaml
 
-from functools import reduce
+from functools import lru_cache, reduce
 
+from expfig.core._load_yaml import fresh_copy, load_yaml
 from expfig.core._str_types import str2none, none2any
 
 
 CMD_LINE_YAML_REPLACEMENTS = [('{', ' {'), (':', ': ')]
 
+# Maximum number of distinct command line yaml fragments whose parsed values are cached.
+FRAGMENT_CACHE_SIZE = 256
+
+_TAGGED = re.compile(r'(![^\s{\[]*)(.*)', re.DOTALL)
+
 
 class YamlType:
     __name__ = 'YamlType'
@@ -51,13 +58,43 @@ def is_yaml_str(value):
 
 
 def _load_yaml_value(value):
-    try:
-        value = yaml.safe_load(value)
-    except yaml.YAMLError:
-        try:
-            value = yaml.safe_load(f'{value} {{}}')
-        except yaml.YAMLError:
-            value = reduce(lambda _str, kv: _str.replace(*kv), CMD_LINE_YAML_REPLACEMENTS, value)
-            value = yaml.safe_load(value)
+    """
+    Load a yaml fragment passed on the command line, e.g. ``'!InsuranceA {value: 10}'``.
+
+    Parsed fragments are cached; each call returns a fresh copy of the cached value.
+    """
+    return fresh_copy(_load_fragment(value))
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def _load_fragment(value):
+    return load_yaml(_repair_fragment(value))
+
+
+def _repair_fragment(value):
+    """
+    Repair common ways of writing yaml fragments on the command line before parsing them.
+
+    * A tag directly followed by a flow collection (``'!InsuranceA{value:10}'``) is separated from it, and a space is
+      inserted after each colon (``CMD_LINE_YAML_REPLACEMENTS``).
+    * A tag of a yaml object constructed from a mapping without a value (``'!InsuranceA'``) is given an empty mapping.
+
+    Other fragments are returned unchanged.
+    """
+    match = _TAGGED.match(value)
+    if match is None:
+        return value
+
+    tag, body = match.groups()
+
+    if body[:1] in ('{', '['):
+        return reduce(lambda _str, kv: _str.replace(*kv), CMD_LINE_YAML_REPLACEMENTS, value)
+    elif not body.strip() and _constructed_from_mapping(tag):
+        return f'{value} {{}}'
 
     return value
+
+
+def _constructed_from_mapping(tag):
+    constructor = yaml.SafeLoader.yaml_constructors.get(tag)
+    return getattr(constructor, '__func__', None) is yaml.YAMLObject.from_yaml.__func__
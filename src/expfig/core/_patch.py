@@ -0,0 +1,75 @@
+from expfig.core._load_yaml import dump_yaml, load_yaml
+
+
+class Patch:
+    """
+    Sequence of operations that transforms one nested dict-like object into another.
+
+    Each operation is a tuple ``(op, path, value)``, where `path` is a tuple of keys and `op` is one of:
+
+    * ``'set'``: add a new key at `path` with `value`.
+    * ``'replace'``: replace the value at `path` with `value`.
+    * ``'delete'``: delete the key at `path`; `value` is None.
+
+    Nested values are stored as plain dicts. Patches are created with :meth:`Namespacify.diff` and applied with
+    :meth:`Namespacify.apply_patch`; they can be serialized to yaml to be sent elsewhere and applied there.
+
+    Parameters
+    ----------
+    operations : iterable of tuple, default ()
+        Operations ``(op, path, value)`` or, for deletions, ``(op, path)``.
+
+    """
+    OPERATIONS = ('set', 'replace', 'delete')
+
+    def __init__(self, operations=()):
+        self.operations = [self._check_operation(*operation) for operation in operations]
+
+    @classmethod
+    def _check_operation(cls, op, path, value=None):
+        if op not in cls.OPERATIONS:
+            raise ValueError(f"Invalid operation '{op}', must be one of {cls.OPERATIONS}.")
+        elif not path:
+            raise ValueError('Cannot patch an empty path.')
+
+        return op, tuple(path), None if op == 'delete' else value
+
+    def to_list(self):
+        """
+        Convert to a list of dicts with keys ``'op'``, ``'path'`` and, except for deletions, ``'value'``.
+        """
+        out = []
+        for op, path, value in self.operations:
+            operation = {'op': op, 'path': list(path)}
+            if op != 'delete':
+                operation['value'] = value
+
+            out.append(operation)
+
+        return out
+
+    @classmethod
+    def from_list(cls, operations):
+        return cls((operation['op'], operation['path'], operation.get('value')) for operation in operations)
+
+    def serialize(self, stream=None):
+        return dump_yaml(self.to_list(), stream=stream)
+
+    @classmethod
+    def deserialize(cls, stream):
+        return cls.from_list(load_yaml(stream) or [])
+
+    def __iter__(self):
+        return iter(self.operations)
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __eq__(self, other):
+        if not isinstance(other, Patch):
+            return NotImplemented
+
+        return self.operations == other.operations
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.operations!r})'
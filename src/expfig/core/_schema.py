@@ -0,0 +1,232 @@
+import argparse
+import hashlib
+import threading
+
+from collections import OrderedDict, UserDict, namedtuple
+
+from expfig.core._array import is_numeric_array
+from expfig.core._parse import element_representatives, parse_arg_type
+from expfig.core.similar_args import SimilarArgsIndex
+from expfig.utils import api
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ArgumentSchema:
+    """
+    Compiled argument table of a default config.
+
+    Maps each '.'-delimited leaf key of the default config to the type (and additional argparse arguments) inferred
+    from its default value. The table depends only on the structure and leaf types of the default, so it can be shared
+    between all `Config` objects built against the same default; only the default values differ between them.
+
+    Parameters
+    ----------
+    arguments : dict
+        Mapping of argument name to a tuple ``(type, additional_args)`` as returned by :func:`parse_arg_type`.
+
+    """
+    def __init__(self, arguments):
+        self.arguments = arguments
+        self._parser = None
+        self._similar_args_index = None
+
+    @classmethod
+    def from_default(cls, default):
+        return cls(_collect_arguments(default))
+
+    def extend(self, leaves):
+        """
+        Add arguments for leaves that are not defined in the schema.
+
+        Parameters
+        ----------
+        leaves : dict
+            Flat mapping of argument name to value, e.g. the leaves of a default config updated with config files.
+
+        Returns
+        -------
+        schema : :class:`ArgumentSchema`
+            ``self`` if all leaves are already defined, otherwise a new (uncached) schema.
+
+        """
+        missing = [k for k in leaves if k not in self.arguments]
+        if not missing:
+            return self
+
+        arguments = self.arguments.copy()
+        for k in missing:
+            _check_key(k)
+            arguments[k] = parse_arg_type(leaves[k], k)
+
+        return type(self)(arguments)
+
+    def get_type(self, arg_name):
+        return self.arguments[arg_name][0]
+
+    @property
+    def parser(self):
+        """
+        argparse parser corresponding to the schema.
+
+        All arguments default to ``argparse.SUPPRESS``; default values should be passed with a namespace, e.g.
+        ``parser.parse_known_args(args, namespace=argparse.Namespace(**defaults))``. This keeps the parser independent
+        of any particular set of default values.
+        """
+        if self._parser is None:
+            self._parser = self._create_parser()
+
+        return self._parser
+
+    @property
+    def similar_args_index(self):
+        """
+        Index of the argument names of the schema (and ``verbose``), to suggest arguments similar to unrecognized ones.
+        """
+        if self._similar_args_index is None:
+            self._similar_args_index = SimilarArgsIndex([*self.arguments, 'verbose'])
+
+        return self._similar_args_index
+
+    def _create_parser(self):
+        parser = argparse.ArgumentParser(argument_default=argparse.SUPPRESS)
+        for arg_name, (_type, additional_args) in self.arguments.items():
+            parser.add_argument(f'--{arg_name}', type=_type, **additional_args)
+
+        if 'verbose' not in self.arguments:
+            parser.add_argument('--verbose', type=int)
+
+        return parser
+
+    def __contains__(self, item):
+        return item in self.arguments
+
+    def __len__(self):
+        return len(self.arguments)
+
+
+class _SchemaCache:
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._schemas = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, default):
+        key = schema_digest(default)
+
+        with self._lock:
+            try:
+                schema = self._schemas[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._schemas.move_to_end(key)
+                return schema
+
+        schema = ArgumentSchema.from_default(default)
+
+        with self._lock:
+            self._schemas[key] = schema
+            if len(self._schemas) > self.maxsize:
+                self._schemas.popitem(last=False)
+
+        return schema
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._schemas))
+
+    def clear(self):
+        with self._lock:
+            self._schemas.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_schema_cache = _SchemaCache()
+
+
+def get_schema(default):
+    """
+    Get the (cached) compiled argument schema of a default config.
+
+    Schemas are cached process-wide and keyed by :func:`schema_digest`.
+    """
+    return _schema_cache.get(default)
+
+
+def schema_cache_info():
+    """
+    Hit/miss statistics of the process-wide schema cache.
+
+    Returns
+    -------
+    info : CacheInfo
+        Named tuple with fields ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+
+    """
+    return _schema_cache.info()
+
+
+def clear_schema_cache():
+    _schema_cache.clear()
+
+
+def schema_digest(default):
+    """
+    Digest of the keys and leaf types of a default config.
+
+    Two defaults with equal digests produce identical argument schemas, regardless of their default values.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_digest(digest, default)
+    return digest.hexdigest()
+
+
+def _update_digest(digest, d):
+    for k, v in d.items():
+        digest.update(repr(k).encode())
+
+        if isinstance(v, (dict, UserDict)) and len(v):
+            digest.update(b'{')
+            _update_digest(digest, v)
+            digest.update(b'}')
+        else:
+            digest.update(_type_signature(v))
+
+
+def _type_signature(value):
+    # Must distinguish exactly the cases distinguished by parse_arg_type.
+    if is_numeric_array(value):
+        return f'!ndarray{value.dtype.str}{value.shape[1:]}{value.ndim}'.encode()
+    elif api.is_list_like(value):
+        return b'[' + b','.join(sorted({_type_signature(x) for x in element_representatives(value)})) + b']'
+    elif getattr(value, 'yaml_tag', None) is not None:
+        return b'!yaml'
+    elif value is None or value == '':
+        return b'~'
+
+    return f':{type(value).__module__}.{type(value).__qualname__}'.encode()
+
+
+def _collect_arguments(d, key=''):
+    arguments = {}
+
+    for k, v in d.items():
+        new_key = f'{key}.{k}' if key else k
+        if isinstance(v, (dict, UserDict)) and len(v):
+            arguments.update(_collect_arguments(v, key=new_key))
+        else:
+            _check_key(new_key)
+            arguments[new_key] = parse_arg_type(v, new_key)
+
+    return arguments
+
+
+def _check_key(key):
+    if '-' in key:
+        raise NameError(f"Invalid character '-' in key '{key}'.")
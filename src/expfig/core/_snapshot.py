@@ -0,0 +1,144 @@
+import marshal
+
+from collections import UserDict
+from logging import getLogger
+from pathlib import Path
+
+from expfig.core._load_yaml import dump_yaml, load_yaml
+
+
+MAGIC = b'EXPFIG-SNAPSHOT'
+VERSION = 1
+SUFFIX = '.snapshot'
+
+NATIVE_TYPES = (str, int, float, bool, bytes, type(None))
+_YAML_MARKER = '!yaml'
+
+logger = getLogger(__name__)
+
+
+def snapshot_path(yaml_path):
+    """
+    Path of the binary snapshot stored next to a yaml file, e.g. ``config.snapshot`` for ``config.yaml``.
+    """
+    return Path(yaml_path).with_suffix(SUFFIX)
+
+
+def write_snapshot(path, data, sources=None):
+    """
+    Write a binary snapshot of a nested dict-like object.
+
+    The snapshot is a versioned header followed by a :mod:`marshal` payload; no pickling is involved. Leaves that
+    are not natively supported (e.g. yaml objects) are stored as their yaml representation.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to write the snapshot to.
+    data : dict-like
+        Object to snapshot.
+    sources : dict-like or None, default None
+        Sources of the values in `data`, e.g. :attr:`Config.sources`.
+
+    """
+    markers = []
+    payload = {
+        'data': _encode(data, markers),
+        'sources': None if sources is None else _encode(sources, markers),
+        'markers': len(markers)
+    }
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC + bytes([VERSION, marshal.version]))
+        f.write(marshal.dumps(payload))
+
+
+def read_snapshot(path):
+    """
+    Read a binary snapshot written by :func:`write_snapshot`.
+
+    Returns
+    -------
+    data : dict
+    sources : dict or None
+
+    """
+    with open(path, 'rb') as f:
+        contents = f.read()
+
+    header_len = len(MAGIC) + 2
+    if contents[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"File '{path}' is not an expfig snapshot.")
+
+    version, marshal_version = contents[len(MAGIC):header_len]
+    if version != VERSION or marshal_version > marshal.version:
+        raise ValueError(f"Unsupported snapshot version {version} (marshal version {marshal_version}) in '{path}'.")
+
+    payload = marshal.loads(contents[header_len:])
+    data, sources = payload['data'], payload['sources']
+
+    if payload['markers']:
+        # Only walk the payload if there are yaml-encoded leaves to decode
+        data, sources = _decode(data), None if sources is None else _decode(sources)
+
+    return data, sources
+
+
+def read_fresh_snapshot(yaml_path):
+    """
+    Read the snapshot stored next to `yaml_path` if it exists and is at least as new as the yaml file.
+
+    Returns
+    -------
+    snapshot : tuple of (dict, dict or None) or None
+        ``(data, sources)`` or None if there is no valid snapshot.
+
+    """
+    path = snapshot_path(yaml_path)
+
+    try:
+        if path.stat().st_mtime_ns < Path(yaml_path).stat().st_mtime_ns:
+            return None
+
+        return read_snapshot(path)
+    except FileNotFoundError:
+        return None
+    except (ValueError, EOFError, TypeError) as e:
+        logger.debug(f"Ignoring invalid snapshot '{path}': {e}")
+        return None
+
+
+def _encode(obj, markers):
+    # Exact types only: marshal writes subclasses of native types, e.g. numpy scalars, as raw bytes or not at all
+    if type(obj) in NATIVE_TYPES:
+        return obj
+    elif isinstance(obj, (dict, UserDict)):
+        return {_encode_key(k, markers): _encode(v, markers) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        # yaml serializes tuples as lists
+        return [_encode(v, markers) for v in obj]
+
+    return _encode_yaml(obj, markers)
+
+
+def _encode_key(key, markers):
+    if type(key) in NATIVE_TYPES:
+        return key
+
+    return _encode_yaml(key, markers)
+
+
+def _encode_yaml(obj, markers):
+    markers.append(obj)
+    return _YAML_MARKER, dump_yaml(obj)
+
+
+def _decode(obj):
+    if isinstance(obj, dict):
+        return {_decode(k): _decode(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_decode(v) for v in obj]
+    elif isinstance(obj, tuple):
+        return load_yaml(obj[1])
+
+    return obj
@@ -0,0 +1,124 @@
+import reprlib
+
+from collections import namedtuple
+from copy import deepcopy
+
+from expfig.core._load_yaml import IMMUTABLE_TYPES
+from expfig.core._parse import get_type
+
+
+InvalidValue = namedtuple('InvalidValue', ['key', 'value', 'type', 'error'])
+
+_value_repr = reprlib.Repr()
+_value_repr.maxstring = 40
+_value_repr.maxother = 40
+
+
+class ValidationReport:
+    """
+    Aggregated result of validating config values against an argument schema, see :func:`validate`.
+
+    Parameters
+    ----------
+    invalid : list of InvalidValue
+        Values that cannot be cast to the type of their argument, as named tuples ``(key, value, type, error)``.
+    missing : list of str
+        Required '.'-delimited keys that are missing from the validated values.
+
+    """
+    def __init__(self, invalid=(), missing=()):
+        self.invalid = list(invalid)
+        self.missing = list(missing)
+
+    @property
+    def ok(self):
+        return not (self.invalid or self.missing)
+
+    def summary(self, max_listed=20):
+        """
+        Summarize the invalid values of the report in a single message.
+
+        Parameters
+        ----------
+        max_listed : int, default 20
+            Maximum number of invalid values to list individually.
+
+        Returns
+        -------
+        summary : str
+
+        """
+        if not self.invalid:
+            return 'All values are valid.'
+
+        lines = [
+            f'{len(self.invalid)} value(s) read from yaml files cannot be cast to the type of the base config value:'
+        ]
+
+        for key, value, _type, _ in self.invalid[:max_listed]:
+            lines.append(f"\t{key}: value {_value_repr.repr(value)} cannot be cast to type '{get_type(_type)}'")
+
+        if len(self.invalid) > max_listed:
+            lines.append(f'\t... and {len(self.invalid) - max_listed} more.')
+
+        return '\n'.join(lines)
+
+    def __len__(self):
+        return len(self.invalid) + len(self.missing)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(invalid={len(self.invalid)}, missing={self.missing})'
+
+
+def validate(leaves, schema, required=()):
+    """
+    Cast and validate config values against an argument schema in a single pass.
+
+    Values that cannot be cast are kept as they are and recorded in the report. Mutable values that are not copied
+    by casting are deep-copied, so that the returned values share no mutable leaves with `leaves`.
+
+    Parameters
+    ----------
+    leaves : dict
+        Flat mapping of '.'-delimited argument name to value.
+    schema : :class:`~expfig.core._schema.ArgumentSchema`
+        Schema defining the type of each argument in `leaves`.
+    required : iterable of str, default ()
+        '.'-delimited keys that must be present in `leaves`, either as keys or as prefixes of nested keys.
+
+    Returns
+    -------
+    values : dict
+        Flat mapping of argument name to cast value.
+    report : :class:`ValidationReport`
+        Invalid values and missing keys.
+
+    """
+    values = {}
+    invalid = []
+    present = set()
+
+    for key, value in leaves.items():
+        _type = schema.get_type(key)
+
+        try:
+            cast = _type(value)
+        except Exception as e:
+            invalid.append(InvalidValue(key, value, _type, e))
+            cast = value
+
+        if cast is value and not isinstance(value, IMMUTABLE_TYPES):
+            cast = deepcopy(value)  # do not share mutable leaves with the default config or config files
+
+        values[key] = cast
+
+        prefix = key
+        while prefix not in present:
+            present.add(prefix)
+            prefix = prefix.rpartition('.')[0]
+            if not prefix:
+                break
+
+    missing = [key for key in required if key not in present]
+
+    return values, ValidationReport(invalid, missing)
@@ -1,17 +1,95 @@
-from difflib import get_close_matches
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
 
 nlt = '\n\t'
 
-best_matches = dict()
+NGRAM = 3
+
+
+class SimilarArgsIndex:
+    """
+    Trigram index of argument names for fast suggestions of arguments similar to unrecognized ones.
+
+    Candidates are the arguments that share the most trigrams with the unrecognized argument; only these are ranked
+    with :class:`difflib.SequenceMatcher`, as in :func:`difflib.get_close_matches`. Building the index is linear in
+    the total length of the argument names; a lookup only touches the arguments that share a trigram with the query.
+
+    Parameters
+    ----------
+    known_args : iterable of str
+        Valid argument names.
+    max_candidates : int, default 256
+        Maximum number of candidates to rank per lookup.
+
+    """
+    def __init__(self, known_args, max_candidates=256):
+        self.known_args = list(dict.fromkeys(known_args))
+        self.max_candidates = max_candidates
+
+        postings = defaultdict(list)
+        for j, arg in enumerate(self.known_args):
+            for gram in _ngrams(arg):
+                postings[gram].append(j)
+
+        self._postings = dict(postings)
+
+    def get_close_matches(self, word, n=3, cutoff=0.6):
+        """
+        Get the known arguments most similar to `word`.
+
+        Equivalent to ``difflib.get_close_matches(word, known_args, n, cutoff)``, except that only the known arguments
+        that share the most trigrams with `word` are considered.
+        """
+        counts = Counter()
+        for gram in _ngrams(word):
+            counts.update(self._postings.get(gram, ()))
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+
+        scored = []
+        for j, _ in counts.most_common(self.max_candidates):
+            matcher.set_seq1(self.known_args[j])
+            if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                ratio = matcher.ratio()
+                if ratio >= cutoff:
+                    scored.append((ratio, self.known_args[j]))
+
+        scored.sort(reverse=True)  # ties in order of difflib.get_close_matches
+        return [arg for _, arg in scored[:n]]
+
+    def __len__(self):
+        return len(self.known_args)
+
+
+def _ngrams(word):
+    padded = f' {word} '
+    return {padded[j:j + NGRAM] for j in range(max(len(padded) - NGRAM + 1, 1))}
 
 
 def get_similar_args(unrecognized_args, known_args):
-    unrecognized_options = [opt.partition('=')[0].lstrip('-') for opt in unrecognized_args if opt.startswith('--')]
+    """
+    Get the known arguments most similar to each unrecognized option.
+
+    Parameters
+    ----------
+    unrecognized_args : list of str
+        Unrecognized command line tokens. Only options (starting with '--') are matched.
+    known_args : iterable of str or :class:`SimilarArgsIndex`
+        Valid argument names, or an index of them.
 
-    for bad_opt in unrecognized_options:
-        best_matches[f'--{bad_opt}'] = [f'--{s}' for s in get_close_matches(bad_opt, known_args)]
+    Returns
+    -------
+    similar_args : dict
+        Mapping of each unrecognized option to a list of similar options.
+
+    """
+    index = known_args if isinstance(known_args, SimilarArgsIndex) else SimilarArgsIndex(known_args)
+    unrecognized_options = [opt.partition('=')[0].lstrip('-') for opt in unrecognized_args if opt.startswith('--')]
 
-    return best_matches
+    return {
+        f'--{bad_opt}': [f'--{s}' for s in index.get_close_matches(bad_opt)] for bad_opt in unrecognized_options
+    }
 
 
 def get_similar_args_str_fmt(unrecognized_args, known_args):
@@ -1,17 +1,17 @@
-import argparse
 import sys
 import os
-import yaml
 
-from copy import deepcopy
-
-from collections import UserDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from warnings import warn
 
 from . import Namespacify, nested_dict_update
-from .core import flatten, unflatten, get_similar_args_str_fmt
-from .core._parse import ListType, ListAction, parse_arg_type, get_type
+from .core import unflatten, get_similar_args_str_fmt
+from .core._argv import ArgvEngine
+from .core._layers import ConfigLayers
+from .core._load_yaml import load_yaml_file
+from .core._schema import get_schema
+from .core._validation import validate
 from .logging import get_logger
 from .utils import api
 
@@ -42,32 +42,122 @@ class Config(Namespacify):
         Handling method for values loaded from config files (either via `--config <filename>` or passed via `config`
         parameter) that cannot be cast to the type of the value in the default config.
         * 'ignore': silently allow mistyped values.
-        * 'warn': allow mistyped values and raise a warning if encountered.
-        * 'error': raise `TypeError`s on mistyped values.
+        * 'warn': allow mistyped values and log a single warning summarizing all of them if any are encountered.
+        * 'error': raise a `TypeError` summarizing all mistyped values.
+        In all cases, the mistyped values are listed in the `validation_report` attribute.
+    argv : list of str or None, default None
+        Command line arguments to parse, excluding the program name. If None, uses ``sys.argv[1:]``.
+    lazy : bool, default False
+        Whether to defer loading the default config and parsing the command line and config files until the config
+        is first accessed. Sources are then only collected if `sources` or `all_sources` is accessed.
+        Final values are identical to those of a non-lazy config; errors are raised on first access.
     Attributes
     ----------
 
     """
-    def __init__(self, config=None, default=DEFAULT_CONFIG_PATH, track_sources=True, yaml_type_handling='warn'):
+    def __init__(self, config=None, default=DEFAULT_CONFIG_PATH, track_sources=True, yaml_type_handling='warn',
+                 lazy=False, argv=None):
         assert yaml_type_handling in ('ignore', 'warn', 'error'), \
             "yaml_type_handling must be one of 'ignore', 'warn', error'"
 
         self.yaml_type_handling = yaml_type_handling
 
-        self.default_config = DefaultConfig(self._parse_default(config, default))
         self.logger = get_logger()
         self.verbosity = 0
 
         self._source_def = SourceTracker(track_sources)
 
-        super().__init__(self._parse_config())
+        argv = sys.argv[1:] if argv is None else argv
+
+        if lazy:
+            self.__dict__['_deferred'] = (config, default, list(argv))
+        else:
+            self._build(config, default, argv)
+            self._flush_sources()
+
+    @classmethod
+    def from_argvs(cls, argvs, config=None, default=DEFAULT_CONFIG_PATH, workers=None, **kwargs):
+        """
+        Build one config per command line concurrently.
+
+        The default config is loaded and its argument schema compiled once, and shared between all configs.
+
+        Parameters
+        ----------
+        argvs : iterable of list of str
+            Command lines to build configs from, excluding the program name.
+        config : str, Path, dict, None or list of str, dict, or Path, default None
+            See :class:`Config`. Passed to every config.
+        default : str, dict, Path or :class:`DefaultConfig`, default `os.path.join(os.getcwd(), 'default_config.yaml')`
+            See :class:`Config`.
+        workers : int or None, default None
+            Maximum number of threads to build configs in. If None, uses the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`. If 0, configs are built serially in the calling thread.
+        **kwargs
+            Additional keyword arguments passed to :class:`Config`.
+
+        Returns
+        -------
+        configs : list of :class:`Config`
+            Configs, in the order of `argvs`.
+
+        """
+        if not isinstance(default, DefaultConfig):
+            default = DefaultConfig(cls._parse_default(config, default))
+
+        default._get_schema()
+
+        def build(argv):
+            return cls(config=config, default=default, argv=argv, **kwargs)
+
+        if workers == 0:
+            return [build(argv) for argv in argvs]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(build, argvs))
+
+    def _build(self, config, default, argv):
+        if isinstance(default, DefaultConfig):
+            self.default_config = default
+        else:
+            self.default_config = DefaultConfig(self._parse_default(config, default))
+
+        super().__init__(self._parse_config(argv))
 
         self.update_with_configs(config)
         self.verbose(self.verbosity)
 
+    def _build_if_deferred(self):
+        try:
+            config, default, argv = self.__dict__.pop('_deferred')
+        except KeyError:
+            return False
+
+        self._build(config, default, argv)
+        return True
+
+    def _flush_sources(self):
         self.sources, self.all_sources = self._source_def.flush()
 
-    def _parse_default(self, config, default):
+    def __getattr__(self, item):
+        if self._build_if_deferred():
+            return getattr(self, item)
+        elif item in ('sources', 'all_sources') and '_source_def' in self.__dict__ and 'data' in self.__dict__:
+            self._flush_sources()
+            return getattr(self, item)
+
+        return super().__getattr__(item)
+
+    def __copy__(self):
+        self._build_if_deferred()
+        return super().__copy__()
+
+    def __getstate__(self):
+        self._build_if_deferred()
+        return super().__getstate__()
+
+    @staticmethod
+    def _parse_default(config, default):
         if api.is_dict_like(default):
             return unflatten(default)
 
@@ -85,91 +175,56 @@ class Config(Namespacify):
                   f'Unable to find a file amongst these candidates.'
         raise ValueError(err_msg)
 
-    def _parse_config(self):
+    def _parse_config(self, argv):
         # First we parse any --config arguments and load those
         # Then we can override them with any other passed values.
-        base_config = deepcopy(self.default_config)
-        self._source_def.add_from_source(base_config, 'DEFAULT')
+        schema = self.default_config._get_schema()
+        parsed_argv = ArgvEngine(schema).parse(argv)
 
-        config_file_args, other_args = self._split_config_file_args()
-        config_files = self._create_config_file_parser().parse_args(args=config_file_args)
-        self.update_with_configs(config_files.config, base_config)
+        # Resolve values through layers instead of copying the default config: leaves of the default
+        # are only copied if they are mutable and not already copied by type casting.
+        layers = self._source_def.layers
+        self._source_def.add_from_source(self.default_config, 'DEFAULT')
+        self.update_with_configs(parsed_argv.config_files, layers)
 
-        parser = self._create_parser(default=base_config)
-        parsed_args = parser.parse_known_args(args=other_args)
-        self._source_def.add_from_argparse(parser, other_args)
-
-        if len(parsed_args[1]):
-            valid_option_keys = sorted(parsed_args[0].__dict__.keys())
-            warn_msg = get_similar_args_str_fmt(parsed_args[1], valid_option_keys)
-            warn(warn_msg)
-
-        args_dict = self._extract_verbosity(parsed_args[0].__dict__)
-        restructured = unflatten(args_dict)
-
-        self._check_restructured(restructured, self.default_config)
-        return restructured
-
-    def _split_config_file_args(self):
-        config_arg_loc = [x.startswith('--config') for x in sys.argv]
-
-        if sum(config_arg_loc) > 1:
-            msg = "Multiple --config arguments encountered. Pass multiple configs with a single --config prefix, e.g. " \
-                  "'python script.py --config config_1.yaml config_2.yaml'"
-            raise TypeError(msg)
-
-        try:
-            config_key_idx = sys.argv.index('--config')
-        except ValueError:
-            try:
-                # single string starting with '--config'
-                assert sum(config_arg_loc) == 1
-            except AssertionError:
-                return [], sys.argv[1:]
-            else:
-                config_arg_loc = config_arg_loc.index(True)
-                config_arg = sys.argv[config_arg_loc]
+        arguments = layers.leaves()
+        extended_schema = schema.extend(arguments)
 
-                other_args = sys.argv[1:].copy()
-                other_args.pop(config_arg_loc-1)
+        if extended_schema is not schema:
+            # config files defined arguments that are not in the default config
+            parsed_argv = ArgvEngine(extended_schema).parse(argv)
 
-                return [config_arg], other_args
+        if parsed_argv.values:
+            self._source_def.add_from_source(unflatten(parsed_argv.values), 'ARGV')
 
-            return [], sys.argv[1:]
+        if parsed_argv.unrecognized:
+            warn_msg = get_similar_args_str_fmt(parsed_argv.unrecognized, extended_schema.similar_args_index)
+            warn(warn_msg)
 
-        config_args = []
-        other_args = []
-        try:
-            next_optional_arg = [j for j in range(config_key_idx+1, len(sys.argv)) if '--' in sys.argv[j]][0]
-        except IndexError:
-            # no optional args following config arguments
-            next_optional_arg = float('inf')
-
-        for j, arg in enumerate(sys.argv[1:], start=1):
-            if config_key_idx <= j < next_optional_arg:
-                config_args.append(arg)
-            else:
-                other_args.append(arg)
+        args_dict = self._collect_arguments(arguments, extended_schema)
+        args_dict.update(parsed_argv.values)
 
-        assert set(config_args).union(other_args) == set(sys.argv[1:])
-        assert not set(config_args).intersection(other_args)
+        args_dict = self._extract_verbosity(args_dict)
+        return unflatten(args_dict)
 
-        return config_args, other_args
+    def _collect_arguments(self, arguments, schema):
+        defaults, self.validation_report = validate(arguments, schema, required=self.default_config.flatten())
 
-    def _create_parser(self, default=None):
-        parser = argparse.ArgumentParser()
-        for arg_name, arg_info in self._get_arguments(d=default).items():
-            parser.add_argument(f'--{arg_name}', **arg_info)
+        if self.validation_report.missing:
+            raise RuntimeError(f'Missing keys {self.validation_report.missing} in restructured config.')
+        elif self.validation_report.invalid:
+            self._handle_invalid(self.validation_report)
 
-        if parser.get_default('verbose') is None:
-            parser.add_argument('--verbose', default=0, type=int)
+        if 'verbose' not in defaults:
+            defaults['verbose'] = 0
 
-        return parser
+        return defaults
 
-    def _create_config_file_parser(self):
-        parser = argparse.ArgumentParser()
-        parser.add_argument('--config', default=[], nargs='+', type=ListType.from_type(str), action=ListAction)
-        return parser
+    def _handle_invalid(self, report):
+        if self.yaml_type_handling == 'error':
+            raise TypeError(report.summary()) from report.invalid[0].error
+        elif self.yaml_type_handling == 'warn':
+            self.logger.warning(report.summary())
 
     def update_with_configs(self, configs, updatee=None):
         """
@@ -204,14 +259,18 @@ class Config(Namespacify):
 
     def _update_with_config(self, config, updatee=None):
         if isinstance(config, (str, Path)):
-            loaded_config = _config_from_yaml(config)
-            self._source_def.add_from_source(loaded_config, config)
-            config = loaded_config
+            source = config
+            config = _config_from_yaml(config)
         else:
-            self._source_def.add_from_source(config, f'CONFIG-SDK')
+            source = 'CONFIG-SDK'
 
         config = self._restructure_as_necessary(config)
 
+        self._source_def.add_from_source(config, source)
+
+        if updatee is self._source_def.layers:
+            return updatee  # the config was pushed as a layer, values are resolved through the layers
+
         if updatee:
             return nested_dict_update(updatee, config)
         else:
@@ -236,57 +295,8 @@ class Config(Namespacify):
 
         return config
 
-    def _check_restructured(self, restructured, default_config, *stack):
-        for key, value in default_config.items():
-            if key not in restructured:
-                raise RuntimeError(f'Missing key {"->".join([*stack, key])} in restructured config.')
-            elif isinstance(value, dict):
-                self._check_restructured(restructured[key], value, *stack, key)
-
-    def _get_arguments(self, key='', d=None):
-        if d is None:
-            d = self.default_config
-
-        args = {}
-
-        for k, v in d.items():
-            new_key = f'{key}.{k}' if key else k
-            if isinstance(v, (dict, UserDict)) and len(v):
-                args.update(self._get_arguments(key=new_key, d=v))
-            else:
-                if '-' in new_key:
-                    raise NameError(f"Invalid character '-' in key '{new_key}'.")
-
-                base_default = self.default_config.get(tuple(new_key.split('.')), v)
-                args[new_key] = self._collect_argument(v, base_default, new_key)
-
-        return args
-
-    def _collect_argument(self, default_val, base_default, arg_name):
-        arg = {}
-
-        _type, additional_args = parse_arg_type(base_default, arg_name)
-
-        arg.update(additional_args)
-
-        try:
-            default = _type(default_val)
-        except Exception as e:
-            msg = f"Value '{default_val}' read from yaml file cannot be case to type '{_type.type}' "\
-                  f"of base config value."
-            if self.yaml_type_handling == 'error':
-                raise TypeError(msg) from e
-            elif self.yaml_type_handling == 'warn':
-                self.logger.warning(msg)
-
-            default = default_val
-
-        arg.update({'default': default, 'type': _type})
-
-        return arg
-
-
-    def serialize_to_dir(self, log_dir, fname='config.yaml', use_existing_dir=False, with_default=False):
+    def serialize_to_dir(self, log_dir, fname='config.yaml', use_existing_dir=False, with_default=False,
+                         snapshot=False):
         """
         Save the config as a yaml file in a directory.
 
@@ -308,13 +318,17 @@ class Config(Namespacify):
             in the same `log_dir` as the config. The symmetric difference is also serialized as
             `config_difference.yaml`.
 
+        snapshot : bool, default False
+            Whether to also write a binary snapshot of the config and its sources next to the yaml file, e.g.
+            `config.snapshot`. See :meth:`Namespacify.from_yaml` and :meth:`Namespacify.from_snapshot`.
+
         Returns
         -------
         log_dir : str
             Path of the log dir the config was serialized to.
 
         """
-        log_dir = super().serialize_to_dir(log_dir, fname=fname, use_existing_dir=use_existing_dir)
+        log_dir = super().serialize_to_dir(log_dir, fname=fname, use_existing_dir=use_existing_dir, snapshot=snapshot)
 
         if with_default:
             path = Path(fname)
@@ -351,54 +365,55 @@ class DefaultConfig(Namespacify):
 
         super().__init__(default)
 
+    def _get_schema(self):
+        """
+        Compiled argument schema of the default config, cached until the default config is mutated.
+        """
+        caches = self._get_caches()
+
+        try:
+            return caches['schema']
+        except KeyError:
+            schema = caches['schema'] = get_schema(self)
+            return schema
+
 
 class SourceTracker:
+    """
+    Track the source of each value of a config.
+
+    Each update of a config is recorded as a layer of a :class:`~expfig.core._layers.ConfigLayers` stack, which
+    `Config` also resolves its values through. Sources are only resolved from the layers when :meth:`flush` is called,
+    so tracking costs nothing for configs whose sources are never read.
+    """
     def __init__(self, track=True):
         self.track = track
-        self._sources = dict()
+        self.layers = ConfigLayers()
         self._all_sources = set()
 
     def add_from_source(self, updated_in_source, source):
-        if not self.track:
-            return
-
-        if source in self._all_sources:
+        if self.track and source in self._all_sources:
             raise ValueError(f"Duplicate source '{source}'")
 
-        from_source = dict.fromkeys(flatten(updated_in_source).keys(), source)
-        self._sources.update(from_source)
+        self.layers.push(source, updated_in_source)
         self._all_sources.add(source)
 
-    def add_from_argparse(self, parser, args):
-        if not self.track:
-            return
-
-        for action in parser._actions:
-            action.type = None
-            action.default = argparse.SUPPRESS
-
-        parsed = parser.parse_known_args(args)
-        passed_args = parsed[0].__dict__
-
-        if passed_args:
-            self.add_from_source(passed_args, 'ARGV')
-
     def flush(self):
         if not self.track:
+            self.layers.clear()
             return None, set()
 
-        sources = Namespacify(unflatten(self._sources))
+        sources = Namespacify(self.layers.sources())
         all_sources = self._all_sources.copy()
 
-        self._sources.clear()
+        self.layers.clear()
         self._all_sources.clear()
 
         return sources, all_sources
 
 
 def _config_from_yaml(file_path):
-    contents = Path(file_path).expanduser().open('r')
-    loaded_contents = yaml.safe_load(contents)
+    loaded_contents = load_yaml_file(file_path)
 
     if not isinstance(loaded_contents, dict):
         raise ValueError(f'Contents of file "{file_path}" deserialize into object of type '
@@ -1,2 +1,3 @@
 from expfig.core import depth, unflatten, flatten, nested_dict_update, str2bool, str2none
 from .comparison import compare
+from .run_index import RunIndex
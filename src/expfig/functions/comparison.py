@@ -1,9 +1,17 @@
+import numpy as np
+
 from expfig import Namespacify
+from expfig.core._equality import _is_real
+from expfig.namespacify import equal
 from expfig.utils.dependencies import pandas as pd
 from expfig.utils.api import is_dict_like
 
 
-def compare(ns, base=None):
+_MISSING_CODE = -1
+_UNKNOWN_CODE = -2
+
+
+def compare(ns, base=None, workers=1, atol=0.0, rtol=0.0):
     """
     Parameters
     ----------
@@ -12,9 +20,18 @@ def compare(ns, base=None):
     base: Namespacify, path-like or None, default None.
         Base namespacify to compare to. If None, only pairwise comparisons are performed. Otherwise, both pairwise and
         comparisons to the base are performed.
+    workers: int or None, default 1
+        Maximum number of processes to load yaml files in, see :meth:`Namespacify.from_yaml_many`. By default, files
+        are loaded in this process; starting a process pool only pays off for many (or large) files.
+    atol, rtol: float, default 0.0
+        Absolute and relative tolerance of comparisons of numeric values, see :func:`expfig.namespacify.equal`.
 
     Returns
     -------
+    comparison : pd.DataFrame
+        Values that differ between any two namespacifys (or a namespacify and `base`). Columns correspond to each
+        namespacify, and the index to the (nested) keys of the differing values. Values that do not differ from any
+        other namespacify are NaN.
 
     """
     if base is not None:
@@ -23,18 +40,126 @@ def compare(ns, base=None):
     if not is_dict_like(ns):
         ns = dict(enumerate(ns))
 
-    ns = {str(k): _load_if_necessary(v) for k, v in ns.items()}
+    ns = _load_all(ns, workers)
+
+    # Flatten each namespacify once into a matrix over the union of paths; base (if any) is the last row.
+    # Tuple paths keep keys that contain '.' (or are not str) intact, as in Namespacify.to_series.
+    flat = [dict(namespace._iter_leaves()) for namespace in ns.values()]
+    if base is not None:
+        flat.append(dict(base._iter_leaves()))
+
+    keys, values, codes = _columnar(flat)
+    missing = codes == _MISSING_CODE
+
+    differing = _differing_columns(values, codes)
+
+    # Without tolerance, a key differs for every namespacify that contains it, or for none of them
+    included = ~missing & differing
+    if atol or rtol:
+        _apply_tolerance(included, values, missing, atol, rtol)
+
+    n_columns = len(ns)
+    included = included[:n_columns]
+    keep = included.any(axis=0)
+
+    values, included = values[:n_columns, keep], included[:, keep]
+    keys = [k for k, d in zip(keys, keep) if d]
+
+    index = pd.MultiIndex.from_tuples(keys) if keys else pd.Index([])
+    columns = {
+        name: pd.Series([v if inc else np.nan for v, inc in zip(values[j], included[j])], index=index)
+        for j, name in enumerate(ns)
+    }
+
+    return pd.concat(columns, axis=1).sort_index()
+
+
+def _columnar(flat):
+    """
+    Collect flat dicts into an object matrix with one row per dict and one column per key.
+
+    Returns
+    -------
+    keys : list
+        Union of the keys of all dicts, in order of first appearance.
+    values : np.ndarray
+        Object array of shape ``(len(flat), len(keys))``.
+    codes : np.ndarray
+        Integer array of the same shape. Values that compare equal share a non-negative code; missing values are
+        ``_MISSING_CODE`` and values that cannot be coded (unhashable values and NaN) are ``_UNKNOWN_CODE``.
+
+    """
+    key_ids = {}
+    for d in flat:
+        for k in d:
+            key_ids.setdefault(k, len(key_ids))
+
+    values = np.empty((len(flat), len(key_ids)), dtype=object)
+    codes = np.full(values.shape, _MISSING_CODE, dtype=np.int64)
+    value_codes = {}
+
+    for j, d in enumerate(flat):
+        row_values, row_codes = values[j], codes[j]
+
+        for k, value in d.items():
+            col = key_ids[k]
+            row_values[col] = value
+            row_codes[col] = _code(value, value_codes)
+
+    return list(key_ids), values, codes
+
+
+def _code(value, value_codes):
+    if isinstance(value, (float, np.floating)) and value != value:
+        return _UNKNOWN_CODE
+
+    try:
+        # Hash-based, so values that compare equal (e.g. 1, 1.0 and True) share a code
+        return value_codes.setdefault(value, len(value_codes))
+    except TypeError:
+        return _UNKNOWN_CODE
+
+
+def _differing_columns(values, codes):
+    """
+    Boolean mask of the columns in which any two rows differ, including by one of them missing the key.
+
+    Columns are compared by their codes; columns with values that cannot be coded (e.g. lists, arrays and NaN) are
+    compared element-wise with :func:`expfig.namespacify.equal`.
+    """
+    differing = (codes == _MISSING_CODE).any(axis=0) | (codes != codes[:1]).any(axis=0)
+
+    for col in np.flatnonzero(~differing & (codes == _UNKNOWN_CODE).any(axis=0)):
+        first = values[0, col]
+        differing[col] = not all(equal(first, value) for value in values[:, col])
+
+    return differing
+
+
+def _apply_tolerance(included, values, missing, atol, rtol):
+    # With tolerance, equality is not transitive: a value may differ from some values in its column but not others.
+    # Columns with missing values differ regardless of tolerance.
+    for col in np.flatnonzero(included.any(axis=0) & ~missing.any(axis=0)):
+        column = values[:, col]
+
+        if all(_is_real(v) for v in column):
+            x = column.astype(float)
+            close = (x[:, None] == x[None, :]) | (np.abs(x[:, None] - x[None, :]) <= atol + rtol * np.abs(x[None, :]))
+        else:
+            close = np.array([[equal(a, b, atol=atol, rtol=rtol) for b in column] for a in column])
+
+        included[:, col] = ~close.all(axis=1)
+
 
-    pairwise_diffs = {}
-    for name, namespace in ns.items():
-        diffs = []
-        if base is not None:
-            diffs.append(namespace.difference(base).to_series())
+def _load_all(ns, workers):
+    paths = {k: v for k, v in ns.items() if not isinstance(v, Namespacify)}
+    loaded = dict(zip(paths, Namespacify.from_yaml_many(paths.values(), workers=workers)))
 
-        diffs.extend(namespace.difference(other_namespace).to_series() for other_namespace in ns.values())
-        pairwise_diffs[name] = pd.concat(diffs).drop_duplicates()
+    for k, value in loaded.items():
+        if isinstance(value, Exception):
+            raise ValueError(f"Unable to load '{paths[k]}'.") from value
 
-    return pd.concat(pairwise_diffs, axis=1).sort_index()
+    return {str(k): loaded.get(k, v) for k, v in ns.items()}
 
 
 def _load_if_necessary(value):
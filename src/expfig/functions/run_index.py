@@ -0,0 +1,228 @@
+import numbers
+import os
+import sqlite3
+
+from logging import getLogger
+from pathlib import Path
+
+from expfig import Namespacify
+from expfig.utils.dependencies import pandas as pd
+
+
+logger = getLogger(__name__)
+
+OPERATORS = ('==', '!=', '<', '<=', '>', '>=')
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leaves (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    num NUMERIC,
+    text TEXT,
+    PRIMARY KEY (run_id, key)
+);
+CREATE INDEX IF NOT EXISTS leaves_num ON leaves(key, num);
+CREATE INDEX IF NOT EXISTS leaves_text ON leaves(key, text);
+"""
+
+
+class RunIndex:
+    """
+    Persistent SQLite index of serialized configs, e.g. of the runs in a log directory.
+
+    Each indexed file is stored with its modification time and size, its contents and its flattened leaves
+    (see :meth:`Namespacify.flatten`). Numeric (including bool), string and null leaves can be queried without parsing
+    any yaml; other leaves (e.g. lists and yaml objects) are stored but cannot be queried.
+
+    Parameters
+    ----------
+    db_path : str or Path
+        Path of the SQLite database. Created if it does not exist. Pass ``':memory:'`` for an in-memory index.
+
+    Examples
+    --------
+    >>> index = RunIndex('runs.sqlite')
+    >>> index.update('logs')
+    >>> index.query({'optimizer.lr': 3e-4, 'model.depth': ('>', 12)})
+    {'/abs/path/to/logs/run_3/config.yaml': {'optimizer': {'lr': 0.0003, ...}, 'model': {'depth': 16, ...}}}
+
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connection = sqlite3.connect(str(db_path))
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.executescript(_SCHEMA)
+
+    def update(self, root, fname='config.yaml', workers=1):
+        """
+        Index all files named `fname` in `root` and its subdirectories.
+
+        Only new files and files whose modification time or size changed since they were last indexed are read.
+        Indexed files in `root` that no longer exist are removed from the index.
+
+        Parameters
+        ----------
+        root : str or Path
+            Directory to search for files, e.g. the directory passed to :meth:`Config.serialize_to_dir`.
+        fname : str, default 'config.yaml'
+            Name of the files to index.
+        workers : int or None, default 1
+            Maximum number of processes to parse files in, see :meth:`Namespacify.from_yaml_many`. By default, files
+            are parsed in this process.
+
+        Returns
+        -------
+        n_indexed : int
+            Number of files that were (re)indexed.
+
+        """
+        root = Path(root).resolve()
+        prefix = f'{root}{os.sep}'
+        indexed = {
+            path: (mtime_ns, size) for path, mtime_ns, size in self._connection.execute(
+                'SELECT path, mtime_ns, size FROM runs WHERE substr(path, 1, ?) = ?', (len(prefix), prefix)
+            )
+        }
+
+        changed = {}
+        for path in root.rglob(fname):
+            stat = path.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+
+            if indexed.pop(str(path), None) != version:
+                changed[str(path)] = version
+
+        loaded = Namespacify.from_yaml_many(changed, workers=workers)
+
+        n_indexed = 0
+        with self._connection:
+            self._connection.executemany('DELETE FROM runs WHERE path = ?', [(path, ) for path in indexed])
+
+            for (path, (mtime_ns, size)), namespacify in zip(changed.items(), loaded):
+                if isinstance(namespacify, Exception):
+                    logger.warning(f"Unable to index '{path}': {namespacify}")
+                    continue
+
+                self._insert(path, mtime_ns, size, namespacify)
+                n_indexed += 1
+
+        return n_indexed
+
+    def _insert(self, path, mtime_ns, size, namespacify):
+        self._connection.execute('DELETE FROM runs WHERE path = ?', (path, ))
+        run_id = self._connection.execute(
+            'INSERT INTO runs (path, mtime_ns, size, document) VALUES (?, ?, ?, ?)',
+            (path, mtime_ns, size, namespacify.serialize())
+        ).lastrowid
+
+        self._connection.executemany(
+            'INSERT INTO leaves (run_id, key, kind, num, text) VALUES (?, ?, ?, ?, ?)',
+            [(run_id, key, *_encode_leaf(value)) for key, value in namespacify.flatten().items()]
+        )
+
+    def query(self, where=None, as_frame=False):
+        """
+        Get the indexed configs that satisfy all conditions in `where`.
+
+        Parameters
+        ----------
+        where : dict or None, default None
+            Mapping of '.'-delimited keys to conditions. A condition is either a value, which the leaf must equal, or a
+            tuple ``(operator, value)`` with operator one of ``'=='``, ``'!='``, ``'<'``, ``'<='``, ``'>'`` or
+            ``'>='``. Values must be numbers, bools, strings or None. If None, returns all indexed configs.
+        as_frame : bool, default False
+            Whether to return a DataFrame with one row per config and one column per leaf, instead of a dict.
+
+        Returns
+        -------
+        configs : dict of str to :class:`.Namespacify` or pd.DataFrame
+            Matching configs, keyed (or indexed) by path.
+
+        """
+        clauses, params = [], []
+        for key, condition in (where or {}).items():
+            clause, clause_params = _condition_clause(key, condition)
+            clauses.append(clause)
+            params.extend(clause_params)
+
+        sql = 'SELECT path, document FROM runs'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+
+        configs = {
+            path: Namespacify.deserialize(document)
+            for path, document in self._connection.execute(sql + ' ORDER BY path', params)
+        }
+
+        if as_frame:
+            return pd.DataFrame.from_dict({path: ns.flatten() for path, ns in configs.items()}, orient='index')
+
+        return configs
+
+    def paths(self):
+        return [path for path, in self._connection.execute('SELECT path FROM runs ORDER BY path')]
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _encode_leaf(value):
+    if value is None:
+        return 'none', None, None
+    elif isinstance(value, numbers.Integral) and _INT64_MIN <= value <= _INT64_MAX:
+        # Stored as an integer, not a float that cannot represent ints above 2 ** 53 exactly (e.g. seeds or ids)
+        return 'num', int(value), None
+    elif isinstance(value, numbers.Real):
+        return 'num', float(value), None
+    elif isinstance(value, str):
+        return 'str', None, value
+
+    return 'other', None, None
+
+
+def _condition_clause(key, condition):
+    if isinstance(condition, tuple):
+        try:
+            operator, value = condition
+        except ValueError:
+            raise ValueError(f"Invalid condition {condition!r} for key '{key}', must be (operator, value).")
+
+        if operator not in OPERATORS:
+            raise ValueError(f"Invalid operator '{operator}' for key '{key}', must be one of {OPERATORS}.")
+    else:
+        operator, value = '==', condition
+
+    kind, num, text = _encode_leaf(value)
+    sql_operator = '=' if operator == '==' else operator
+
+    if kind == 'none':
+        if operator not in ('==', '!='):
+            raise ValueError(f"Invalid operator '{operator}' for value None of key '{key}'.")
+
+        kind_operator = '=' if operator == '==' else '!='
+        return f"id IN (SELECT run_id FROM leaves WHERE key = ? AND kind {kind_operator} 'none')", [key]
+    elif kind == 'other':
+        raise TypeError(f"Cannot query key '{key}' with value of type '{type(value).__name__}'; values must be "
+                        f"numbers, bools, strings or None.")
+
+    column, param = ('num', num) if kind == 'num' else ('text', text)
+    return f'id IN (SELECT run_id FROM leaves WHERE key = ? AND {column} {sql_operator} ?)', [key, param]
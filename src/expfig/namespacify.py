@@ -1,14 +1,24 @@
-import functools
+import datetime
+import hashlib
 import numpy as np
+import os
+import weakref
 import yaml
 
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy as shallowcopy, deepcopy
 from contextlib import contextmanager
 from collections import UserDict
 from logging import getLogger
 
 from . import nested_dict_update
-from .core import depth, flatten
+from .core import depth
+from .core._flatten import _flatten
+from .core._accessor import accessor_class
+from .core._equality import _has_immutable_buffer, equal
+from .core._load_yaml import IMMUTABLE_TYPES, SafeDumper, dump_yaml, fresh_copy, load_yaml, load_yaml_file
+from .core._patch import Patch
+from .core._snapshot import read_fresh_snapshot, read_snapshot, snapshot_path, write_snapshot
 from .logging import make_sequential_log_dir
 
 from expfig.utils.api import is_dict_like
@@ -18,7 +28,15 @@ from expfig.utils.dependencies import pandas as pd
 yaml.SafeDumper.add_multi_representer(UserDict, yaml.SafeDumper.represent_dict)
 logger = getLogger(__name__)
 
+_MISSING = object()
+
+
 class Namespacify(UserDict):
+    _parent = None
+    _path_index = None
+    _caches = None
+    _shared = False
+
     def __init__(self, in_dict):
         super().__init__(in_dict)
 
@@ -42,7 +60,41 @@ class Namespacify(UserDict):
         return str_out
 
     def depth(self):
-        return depth(self)
+        return self._subtree_depth()[0]
+
+    def _subtree_depth(self):
+        """
+        Depth of ``self`` and whether it can be cached, computed in one pass over the nodes without a cached depth.
+
+        The depth of a node may only be cached if all of its dict-like descendants are unshared
+        :class:`.Namespacify` objects, so that any mutation below it reaches it through :meth:`_mutated`.
+        """
+        caches = self._get_caches()
+
+        try:
+            return caches['depth'], True
+        except KeyError:
+            pass
+
+        max_depth, cacheable = 0, True
+
+        for v in self.data.values():
+            if isinstance(v, Namespacify):
+                child_depth, child_cacheable = v._subtree_depth()
+                cacheable = cacheable and child_cacheable and not v._shared
+            elif is_dict_like(v):
+                child_depth, cacheable = depth(v), False
+            else:
+                continue
+
+            max_depth = max(max_depth, child_depth)
+
+        value = 1 + max_depth
+
+        if cacheable:
+            caches['depth'] = value
+
+        return value, cacheable
 
     def to_dict(self, copy=False, *, dump_yaml=False):
         """
@@ -79,41 +131,329 @@ class Namespacify(UserDict):
             if isinstance(value, Namespacify):
                 return value.to_dict()
             if dump_yaml and hasattr(value, 'yaml_tag'):
-                    value = yaml.safe_dump(value, default_flow_style=True).rstrip()
+                    value = yaml.dump(value, Dumper=SafeDumper, default_flow_style=True).rstrip()
 
             return copy_func(value)
 
         return {k: _maybe_copy(v) for k, v in self.items()}
 
     def to_series(self):
-        series = pd.json_normalize(self.to_dict()).squeeze()
+        """
+        Convert to a pandas Series indexed by the path of each leaf.
 
-        try:
-            series.index = pd.MultiIndex.from_tuples([x.split('.') for x in series.index])
-        except TypeError:
-            if not series.empty:
-                raise
+        The index is a MultiIndex with one level per level of nesting; paths shorter than the deepest path are padded
+        with NaN. Empty nested objects are dropped.
+
+        Returns
+        -------
+        series : pd.Series
+
+        """
+        paths, values = [], []
+        for path, value in self._iter_leaves():
+            paths.append(path)
+            values.append(value)
+
+        if not paths:
+            return pd.Series([], dtype=float, name=0)
+
+        # name matches the Series previously obtained by squeezing a one-row DataFrame
+        return pd.Series(values, index=pd.MultiIndex.from_tuples(paths), name=0)
+
+    @classmethod
+    def to_frame(cls, namespacifys):
+        """
+        Convert a batch of dict-like objects to a pandas DataFrame with one row per object.
+
+        Parameters
+        ----------
+        namespacifys : dict or list-like of dict-like
+            Objects to convert. If a dict, its keys are used as the index of the DataFrame.
+
+        Returns
+        -------
+        frame : pd.DataFrame
+            DataFrame with one column per leaf path, as in the index of :meth:`to_series`. Leaves missing from an
+            object are NaN.
 
-        return series
+        """
+        if is_dict_like(namespacifys):
+            index, namespacifys = list(namespacifys.keys()), list(namespacifys.values())
+        else:
+            namespacifys = list(namespacifys)
+            index = None
+
+        rows = [
+            dict((v if isinstance(v, Namespacify) else cls(v))._iter_leaves())
+            for v in namespacifys
+        ]
+
+        paths = {}
+        for row in rows:
+            paths.update(dict.fromkeys(row))
+
+        frame = pd.DataFrame(
+            {j: [row.get(path, np.nan) for row in rows] for j, path in enumerate(paths)},
+            index=index
+        )
+        frame.columns = pd.MultiIndex.from_tuples(paths) if paths else pd.Index([])
+
+        return frame
+
+    def _iter_leaves(self):
+        stack = [((), iter(self.data.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                if isinstance(v, (dict, UserDict)):
+                    stack.append(((*prefix, k), iter(v.items())))
+                    break
+
+                yield (*prefix, k), v
+            else:
+                stack.pop()
 
     def flatten(self, delimiter='.', levels=None):
-        return flatten(self, delimiter=delimiter, levels=levels)
+        """
+        Flatten ``self`` into a dict of `delimiter`-delimited keys, see :func:`~expfig.core.flatten`.
+
+        The flat view is cached per ``(delimiter, levels)`` until ``self`` or one of its descendants is mutated;
+        each call returns a new (shallow) copy of it.
+        """
+        cache_key = ('flatten', delimiter, levels)
+        caches = self._get_caches()
+
+        try:
+            return caches[cache_key].copy()
+        except KeyError:
+            pass
+
+        flat = _flatten(self, delimiter, levels, _node_depth)
+
+        if self._subtree_depth()[1]:
+            caches[cache_key] = flat.copy()
+
+        return flat
+
+    def to_accessor(self):
+        """
+        Copy ``self`` into an instance of a generated ``__slots__`` class.
+
+        The class is generated from the keys and leaf types of ``self`` and cached, so objects with the same structure
+        (e.g. all configs built from one default config) share a class. Values are read with plain attribute access,
+        e.g. ``ns.to_accessor().hyperparams.lr``, which is considerably faster than attribute access on a
+        :class:`.Namespacify`.
+
+        The accessor is a copy: changes to ``self`` are not reflected in it, and vice versa.
+        Use :meth:`from_accessor` or ``accessor.to_namespacify()`` to convert back.
+
+        Returns
+        -------
+        accessor : :class:`~expfig.core._accessor.Accessor`
+
+        """
+        return accessor_class(self, name=type(self).__name__).from_namespacify(self)
+
+    @classmethod
+    def from_accessor(cls, accessor):
+        return cls(accessor.to_dict())
+
+    def index_paths(self, enable=True):
+        """
+        Keep a flat index of all paths in ``self``.
+
+        With the index enabled, tuple paths (``ns['a', 'b', 'c']``) and '.'-delimited string paths (``ns['a.b.c']``)
+        resolve with a single dict lookup. The index is updated in place by writes to ``self`` and its descendants.
+        Shallow copies of an indexed object keep an index of their own and therefore copy nested :class:`.Namespacify`
+        objects, while still sharing all leaves.
+
+        Parameters
+        ----------
+        enable : bool, default True
+            Whether to enable or disable the index.
+
+        Returns
+        -------
+        self : :class:`.Namespacify`
+
+        """
+        self.__dict__['_path_index'] = self._build_path_index() if enable else None
+        return self
+
+    def _build_path_index(self):
+        index = {}
+        for path, value in self._iter_paths():
+            _add_to_index(index, path, value)
 
-    def intersection(self, other):
+        return index
+
+    def _iter_paths(self, prefix=()):
+        for k, v in self.data.items():
+            path = (*prefix, k)
+            yield path, v
+            if isinstance(v, Namespacify):
+                yield from v._iter_paths(path)
+
+    def _get_caches(self):
+        """
+        Dict of values cached on ``self``, cleared whenever ``self`` or one of its descendants is mutated.
+        """
+        if self._caches is None:
+            self.__dict__['_caches'] = {}
+
+        return self._caches
+
+    def _digest(self):
+        """
+        Order-independent content digest of ``self``, or None if the digest is unknown.
+
+        Two objects with equal (non-None) digests are equal, and vice versa. The digest of each node is computed from
+        the digests of its children (Merkle-style) and cached until ``self`` or a descendant is mutated.
+
+        The digest is unknown if ``self`` contains leaves that may be mutated in place (e.g. lists, arrays or yaml
+        objects), or that are not equal to themselves (NaN).
+        """
+        return self._subtree_digest()[0]
+
+    def _subtree_digest(self):
+        caches = self._get_caches()
+
+        try:
+            return caches['digest'], True
+        except KeyError:
+            pass
+
+        entries = []
+        cacheable = True
+
+        for k, v in self.data.items():
+            key_token = _leaf_token(k)
+
+            if isinstance(v, Namespacify):
+                value_token, child_cacheable = v._subtree_digest()
+                # Mutations of a node shared with another tree may not be propagated to self
+                cacheable = cacheable and child_cacheable and not v._shared
+            else:
+                value_token = _leaf_token(v)
+
+            if key_token is None or value_token is None:
+                entries = None
+                break
+
+            entry = hashlib.blake2b(len(key_token).to_bytes(8, 'little'), digest_size=16)
+            entry.update(key_token)
+            entry.update(value_token)
+            entries.append(entry.digest())
+
+        digest = None if entries is None else b'{' + _blake2b(*sorted(entries))
+
+        if cacheable:
+            caches['digest'] = digest
+
+        return digest, cacheable
+
+    def _attach(self, parent, key):
+        if self._parent is not None:
+            current = self._live_parent()
+            if current is not None and (current[0] is not parent or current[1] != key):
+                self.__dict__['_shared'] = True
+                # Mutations of self no longer reach the current ancestors, which must not keep values cached before
+                current[0]._invalidate_caches()
+
+        self.__dict__['_parent'] = (weakref.ref(parent), key)
+
+    def _live_parent(self):
+        """
+        ``(parent, key)`` of ``self``, or None if ``self`` has no parent or is no longer contained in it.
+        """
+        if self._parent is None:
+            return None
+
+        parent_ref, key = self._parent
+        parent = parent_ref()
+        if parent is None or parent.data.get(key) is not self:
+            return None
+
+        return parent, key
+
+    def _invalidate_caches(self):
+        """
+        Clear the caches of ``self`` and its ancestors.
+        """
+        node = self
+        while node is not None:
+            if node._caches is not None:
+                node.__dict__['_caches'] = None
+
+            parent = node._live_parent()
+            node = None if parent is None else parent[0]
+
+    def _mutated(self, path, old, new):
+        """
+        Propagate a mutation of ``self[path]`` from ``old`` to ``new`` to ``self`` and its ancestors.
+
+        ``old`` and ``new`` are ``_MISSING`` for insertions and deletions, respectively.
+        """
+        node = self
+        while True:
+            if node._caches is not None:
+                node.__dict__['_caches'] = None
+
+            if node._path_index is not None:
+                node._update_path_index(path, old, new)
+
+            parent = node._live_parent()
+            if parent is None:
+                break
+
+            node, path = parent[0], (parent[1], *path)
+
+    def _update_path_index(self, path, old, new):
+        index = self._path_index
+
+        if isinstance(old, Namespacify):
+            for subpath, _ in old._iter_paths(path):
+                _remove_from_index(index, subpath)
+
+        if new is _MISSING:
+            _remove_from_index(index, path)
+        else:
+            _add_to_index(index, path, new)
+            if isinstance(new, Namespacify):
+                for subpath, value in new._iter_paths(path):
+                    _add_to_index(index, subpath, value)
+
+    def intersection(self, other, atol=0.0, rtol=0.0):
+        """
+        Get all values that are equal in ``self`` and ``other``.
+
+        Parameters
+        ----------
+        other : dict-like
+            Object to compare against
+        atol, rtol : float, default 0.0
+            Absolute and relative tolerance of comparisons of numeric leaves, see :func:`equal`.
+
+        Returns
+        -------
+        intersection : :class:`.Namespacify`
+            Intersection of ``self`` and ``other``.
+
+        """
         intersection = {}
 
         for k, v in self.items():
             if k in other:
-                if equal(other[k], v):
+                if _equal_values(other[k], v, atol, rtol):
                     intersection[k] = v
                 elif isinstance(v, Namespacify) and isinstance(other[k], Namespacify):
-                    subint = v.intersection(other[k])
+                    subint = v.intersection(other[k], atol=atol, rtol=rtol)
                     if subint:
                         intersection[k] = subint
 
         return Namespacify(intersection)
 
-    def symmetric_difference(self, other):
+    def symmetric_difference(self, other, atol=0.0, rtol=0.0):
         """
         Get all values that differ in ``self`` or ``other``.
 
@@ -128,6 +468,8 @@ class Namespacify(UserDict):
         ----------
         other : dict-like
             Object to compare against
+        atol, rtol : float, default 0.0
+            Absolute and relative tolerance of comparisons of numeric leaves, see :func:`equal`.
 
         Returns
         -------
@@ -151,15 +493,15 @@ class Namespacify(UserDict):
                 diff[k] = self[k]
                 continue
 
-            elif not equal(self[k], other[k]):
+            elif not _equal_values(self[k], other[k], atol, rtol):
                 if isinstance(self[k], Namespacify):
-                    diff[k] = self[k].symmetric_difference(other[k])
+                    diff[k] = self[k].symmetric_difference(other[k], atol=atol, rtol=rtol)
                 else:
                     diff[k] = self[k]
 
         return Namespacify(diff)
 
-    def difference(self, other):
+    def difference(self, other, atol=0.0, rtol=0.0):
         """
         Get all values that are in ``self`` that are NOT (or are different) in ``other``.
 
@@ -170,6 +512,8 @@ class Namespacify(UserDict):
         ----------
         other : dict-like
             Object to compare against
+        atol, rtol : float, default 0.0
+            Absolute and relative tolerance of comparisons of numeric leaves, see :func:`equal`.
 
         Returns
         -------
@@ -183,18 +527,118 @@ class Namespacify(UserDict):
                 diff[k] = v
             elif k not in other:
                 diff[k] = v
-            elif not equal(v, other[k]):
+            elif not _equal_values(v, other[k], atol, rtol):
                 if isinstance(v, Namespacify):
-                    diff[k] = v.difference(other[k])
+                    diff[k] = v.difference(other[k], atol=atol, rtol=rtol)
                 else:
                     diff[k] = v
 
         return Namespacify(diff)
 
+    def diff(self, other, atol=0.0, rtol=0.0):
+        """
+        Get a patch that transforms ``self`` into ``other``.
+
+        Unlike :meth:`difference`, the patch records deletions and can be applied with :meth:`apply_patch`, e.g.
+        ``ns.apply_patch(ns.diff(other)) == other``. Subtrees that are equal in ``self`` and ``other`` are skipped
+        without comparing their leaves where possible, see :meth:`symmetric_difference`.
+
+        Parameters
+        ----------
+        other : dict-like
+            Object to diff against.
+        atol, rtol : float, default 0.0
+            Absolute and relative tolerance of comparisons of numeric leaves, see :func:`equal`.
+
+        Returns
+        -------
+        patch : :class:`~expfig.core.Patch`
+
+        """
+        if not isinstance(other, Namespacify):
+            other = Namespacify(other)
+
+        operations = []
+        _diff(self, other, (), operations, atol, rtol)
+        return Patch(operations)
+
+    def apply_patch(self, patch):
+        """
+        Apply a patch (see :meth:`diff`) to ``self`` in place.
+
+        Only the nodes along the patched paths are modified; cached digests and path indexes of ``self`` and its
+        descendants are updated accordingly.
+
+        Parameters
+        ----------
+        patch : :class:`~expfig.core.Patch` or list of dict
+            Patch, or its representation as returned by :meth:`.Patch.to_list`.
+
+        Returns
+        -------
+        self : :class:`.Namespacify`
+
+        """
+        if not isinstance(patch, Patch):
+            patch = Patch.from_list(patch)
+
+        for op, path, value in patch:
+            try:
+                node = self._get_path_parent(path)
+            except KeyError:
+                raise KeyError(f'Cannot {op} path {path}: parent does not exist.')
+
+            key = path[-1]
+            if (op == 'set') == (key in node.data):
+                raise KeyError(f"Cannot {op} path {path}: path {'exists' if op == 'set' else 'does not exist'}.")
+            elif op == 'delete':
+                del node[key]
+                continue
+
+            value = fresh_copy(value)
+            node[key] = Namespacify(value) if isinstance(value, (dict, UserDict)) else value
+
+        return self
+
+    def _get_path_parent(self, path):
+        node = self
+        for key in path[:-1]:
+            node = node.data[key]
+            if not isinstance(node, Namespacify):
+                raise KeyError(key)
+
+        return node
+
     def serialize(self, stream=None):
-        return yaml.safe_dump(self, stream=stream)
+        return dump_yaml(self, stream=stream)
+
+    def serialize_to_dir(self, log_dir, fname='namespacify.yaml', use_existing_dir=False, snapshot=False):
+        """
+        Save ``self`` as a yaml file in a directory.
+
+        Parameters
+        ----------
+        log_dir : str or Path
+            directory to serialize into.
+
+        fname : str, default 'namespacify.yaml`
+            Name of the file.
+
+        use_existing_dir : bool, default False
+            Whether to serialize to a directory that already exists. If False and `log_dir` exists,
+            ``self`` will be serialized to `{log_dir}_{k}`, where k is the smallest positive integer such that
+            `{log_dir}_{k}` does not currently exist.
+
+        snapshot : bool, default False
+            Whether to also write a binary snapshot next to the yaml file (e.g. `namespacify.snapshot`). The snapshot
+            is loaded by :meth:`from_yaml` in place of the yaml file while it is at least as new as the yaml file.
+
+        Returns
+        -------
+        log_dir : str
+            Path of the log dir ``self`` was serialized to.
 
-    def serialize_to_dir(self, log_dir, fname='namespacify.yaml', use_existing_dir=False):
+        """
         log_dir = make_sequential_log_dir(log_dir, use_existing_dir=use_existing_dir)
         log_file = f'{log_dir}/{fname}'
 
@@ -203,16 +647,75 @@ class Namespacify(UserDict):
 
         logger.info(f'Logged {type(self).__name__} to {log_file}')
 
+        if snapshot:
+            write_snapshot(snapshot_path(log_file), self, sources=self.__dict__.get('sources'))
+
         return log_dir
 
     @classmethod
     def deserialize(cls, stream):
-        return cls(yaml.safe_load(stream))
+        return cls(load_yaml(stream))
 
     @classmethod
     def from_yaml(cls, filepath):
-        with open(filepath, 'r') as stream:
-            return cls.deserialize(stream)
+        """
+        Load from a yaml file.
+
+        If a binary snapshot (see :meth:`serialize_to_dir`) at least as new as the yaml file exists next to it, the
+        snapshot is loaded instead.
+        """
+        return cls(_read_yaml_data(filepath))
+
+    @classmethod
+    def from_yaml_many(cls, filepaths, workers=None):
+        """
+        Load from many yaml files, parsing them in parallel processes.
+
+        Parameters
+        ----------
+        filepaths : iterable of str or Path
+            Paths of yaml files. As with :meth:`from_yaml`, fresh snapshots are loaded in place of yaml files.
+        workers : int or None, default None
+            Maximum number of processes to parse files in. If None, uses the number of CPUs. If 0 or 1, files are
+            parsed serially in this process.
+
+        Returns
+        -------
+        loaded : list of :class:`.Namespacify` or Exception
+            Loaded objects, in the order of `filepaths`. A file that fails to load does not fail the batch; the
+            exception raised while loading it is returned in its place instead.
+
+        """
+        filepaths = list(filepaths)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers <= 1 or len(filepaths) <= 1:
+            results = map(_try_read_yaml_data, filepaths)
+            return [_from_result(cls, result) for result in results]
+
+        chunksize = max(1, len(filepaths) // (4 * workers))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_try_read_yaml_data, filepaths, chunksize=chunksize)
+            return [_from_result(cls, result) for result in results]
+
+    @classmethod
+    def from_snapshot(cls, filepath):
+        """
+        Load from a binary snapshot.
+
+        If the snapshot contains sources (e.g. the snapshot of a :class:`.Config`), they are set as the ``sources``
+        attribute of the returned object.
+        """
+        data, sources = read_snapshot(filepath)
+        out = cls(data)
+
+        if sources is not None:
+            out.__dict__['sources'] = Namespacify(sources)
+
+        return out
 
     def __dir__(self):
         rv = set(super().__dir__())
@@ -225,6 +728,14 @@ class Namespacify(UserDict):
         return sorted(rv)
 
     def __getitem__(self, item):
+        index = self._path_index
+        if index is not None:
+            if type(item) is tuple or (type(item) is str and '.' in item and item not in self.data):
+                try:
+                    return index[item]
+                except (KeyError, TypeError):  # missing or unhashable (e.g. slice), resolve below
+                    pass
+
         try:
             is_adv_slice = item[0] == slice(None) or isinstance(item[0], list)
         except TypeError:
@@ -247,14 +758,94 @@ class Namespacify(UserDict):
 
     def __setitem__(self, key, value):
         if isinstance(key, tuple):
-            nested_update = functools.reduce(lambda val, k: {k: val}, reversed(key), value)
-            nested_dict_update(self, nested_update, nest_namespacify=True)
+            self._set_path(key, value)
 
         elif isinstance(value, dict):
             nested_dict_update(self, {key: value}, nest_namespacify=True)
 
         else:
-            super().__setitem__(key, value)
+            old = self.data.get(key, _MISSING)
+            self.data[key] = value
+
+            attach = getattr(value, '_attach', None)  # faster than isinstance(value, Namespacify)
+            if attach is not None:
+                attach(self, key)
+
+            if self._parent is not None or self._path_index is not None or self._caches is not None:
+                self._mutated((key, ), old, value)
+
+    def _set_path(self, path, value):
+        if not path:
+            nested_dict_update(self, value, nest_namespacify=True)
+            return
+
+        node = self
+        for key in path[:-1]:
+            try:
+                child = node[key]
+            except KeyError:
+                child = None
+
+            if not is_dict_like(child):
+                child = Namespacify({})
+                node[key] = child
+
+            node = child
+
+        if isinstance(value, (dict, UserDict)):
+            nested_dict_update(node, {path[-1]: value}, nest_namespacify=True)
+        else:
+            node[path[-1]] = value
+
+    def __delitem__(self, key):
+        if isinstance(key, tuple):
+            try:
+                node = self._get_path_parent(key)
+            except (KeyError, IndexError):
+                raise KeyError(key)
+
+            del node[key[-1]]
+            return
+
+        old = self.data[key]
+        super().__delitem__(key)
+        self._mutated((key, ), old, _MISSING)
+
+    def __copy__(self):
+        inst = super().__copy__()
+        inst.__dict__.pop('_parent', None)
+        inst.__dict__.pop('_caches', None)
+
+        if self._path_index is not None:
+            # Shared children would only propagate their mutations to self, leaving the index of the copy stale
+            memo = {}
+            for k, v in inst.data.items():
+                if isinstance(v, Namespacify):
+                    v = inst.data[k] = v.deepcopy(deepcopy_leaves=False, memo=memo)
+                    v._attach(inst, k)
+
+            inst.__dict__['_path_index'] = inst._build_path_index()
+            return inst
+
+        for v in inst.data.values():
+            if isinstance(v, Namespacify):
+                v.__dict__['_shared'] = True  # children are shared with self
+
+        return inst
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_parent', None)
+        state.pop('_caches', None)
+        state.pop('_shared', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        for k, v in self.data.items():
+            if isinstance(v, Namespacify):
+                v._attach(self, k)
 
     def __getattr__(self, item):
         if item == 'data':
@@ -276,6 +867,15 @@ class Namespacify(UserDict):
 
         super().__setattr__(key, value)
 
+    def __ior__(self, other):
+        if isinstance(other, UserDict):
+            other = other.data
+
+        for key, value in dict(other).items():
+            self[key] = value  # through __setitem__, so that caches and path indices are kept up to date
+
+        return self
+
     def __xor__(self, other):
         return self.symmetric_difference(other)
 
@@ -286,14 +886,206 @@ class Namespacify(UserDict):
         return self.difference(other)
 
     def __deepcopy__(self, memo=None):
-        return Namespacify(self.to_dict('deep'))
+        return self.deepcopy(memo=memo)
+
+    def deepcopy(self, deepcopy_leaves=True, memo=None):
+        """
+        Copy the structure of ``self`` and, optionally, its leaves.
+
+        Nested :class:`.Namespacify` objects are always copied. Leaves are copied with :func:`copy.deepcopy`
+        semantics: objects referenced multiple times (or cyclically, e.g. by yaml objects) are copied once, as
+        recorded in `memo`. Immutable leaves (e.g. numbers, strings, tuples of these and arrays backed by read-only
+        buffers such as bytes) are not copied, and other numpy arrays are copied with a single buffer copy.
+
+        Parameters
+        ----------
+        deepcopy_leaves : bool, default True
+            Whether to copy leaves. If False, the copy shares all leaves with ``self``.
+        memo : dict or None, default None
+            Memo dictionary, as passed to ``__deepcopy__``.
+
+        Returns
+        -------
+        copied : :class:`.Namespacify`
+
+        """
+        if memo is None:
+            memo = {}
+
+        try:
+            return memo[id(self)]
+        except KeyError:
+            pass
+
+        out = Namespacify({})
+        memo[id(self)] = out
+
+        data = out.data
+        for k, v in self.data.items():
+            if isinstance(v, Namespacify):
+                v = v.deepcopy(deepcopy_leaves=deepcopy_leaves, memo=memo)
+                v._attach(out, k)
+            elif deepcopy_leaves:
+                v = _deepcopy_leaf(v, memo)
+
+            data[k] = v
+
+        if self._path_index is not None:
+            out.__dict__['_path_index'] = out._build_path_index()
+
+        return out
 
 
-def equal(a, b):
+def _read_yaml_data(filepath):
+    snapshot = read_fresh_snapshot(filepath)
+    if snapshot is not None:
+        return snapshot[0]
+
+    return load_yaml_file(filepath)
+
+
+def _try_read_yaml_data(filepath):
     try:
-        return bool(a == b)
-    except ValueError:
-        return np.array_equal(a, b)
+        return _read_yaml_data(filepath), None
+    except Exception as e:
+        return None, e
+
+
+def _from_result(cls, result):
+    data, exception = result
+    if exception is not None:
+        return exception
+
+    try:
+        return cls(data)
+    except Exception as e:
+        return e
+
+
+def _add_to_index(index, path, value):
+    index[path] = value
+    if len(path) > 1 and all(isinstance(k, str) for k in path):
+        index['.'.join(path)] = value
+
+
+def _remove_from_index(index, path):
+    index.pop(path, None)
+    if len(path) > 1 and all(isinstance(k, str) for k in path):
+        index.pop('.'.join(path), None)
+
+
+def _deepcopy_leaf(value, memo):
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    elif type(value) is tuple and all(isinstance(v, IMMUTABLE_TYPES) for v in value):
+        return value
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        if _has_immutable_buffer(value):
+            return value
+
+        try:
+            return memo[id(value)]
+        except KeyError:
+            copied = memo[id(value)] = value.copy()
+            return copied
+
+    return deepcopy(value, memo)
+
+
+def _diff(a, b, prefix, operations, atol, rtol):
+    for k, v in a.data.items():
+        path = (*prefix, k)
+        if k not in b.data:
+            operations.append(('delete', path, None))
+            continue
+
+        other = b.data[k]
+        if _equal_values(v, other, atol, rtol):
+            continue
+        elif isinstance(v, Namespacify) and isinstance(other, Namespacify):
+            _diff(v, other, path, operations, atol, rtol)
+        else:
+            operations.append(('replace', path, _patch_value(other)))
+
+    for k, other in b.data.items():
+        if k not in a.data:
+            operations.append(('set', (*prefix, k), _patch_value(other)))
+
+
+def _patch_value(value):
+    return value.to_dict() if isinstance(value, Namespacify) else value
+
+
+def _node_depth(d):
+    return d.depth() if isinstance(d, Namespacify) else depth(d)
+
+
+def _equal_values(a, b, atol=0.0, rtol=0.0):
+    # Compare subtrees by digest where possible, falling back to comparing each leaf
+    if isinstance(a, Namespacify) and isinstance(b, Namespacify):
+        digest_a = a._digest()
+        if digest_a is not None:
+            digest_b = b._digest()
+            if digest_b is not None and (digest_a == digest_b or not (atol or rtol)):
+                return digest_a == digest_b
+
+        return a.data.keys() == b.data.keys() and all(
+            _equal_values(v, b.data[k], atol, rtol) for k, v in a.data.items()
+        )
+
+    return equal(a, b, atol=atol, rtol=rtol)
+
+
+def _blake2b(*parts):
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part)
+
+    return digest.digest()
+
+
+def _leaf_token(value):
+    # Canonical encoding of immutable leaves: values that compare equal (e.g. 1, 1.0 and True) share a token.
+    # Tokens are distinct from subtree digests, which start with b'{'.
+    if value is None:
+        return b'~'
+    elif isinstance(value, str):
+        return b's' + value.encode('utf-8', 'surrogatepass')
+    elif isinstance(value, bytes):
+        return b'b' + value
+    elif isinstance(value, (int, float, complex, np.bool_, np.number)):
+        return _number_token(value)
+    elif isinstance(value, datetime.date):
+        return f'd{type(value).__name__}:{value.isoformat()}'.encode()
+    elif type(value) is tuple:
+        tokens = [_leaf_token(v) for v in value]
+        if any(t is None for t in tokens):
+            return None
+
+        return b'(' + b''.join(len(t).to_bytes(8, 'little') + t for t in tokens)
+
+    return None
+
+
+def _number_token(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, complex):
+        if value != value:
+            return None
+        elif value.imag:
+            return f'c{value!r}'.encode()
+
+        value = value.real
+
+    if isinstance(value, float):
+        if value != value:
+            return None
+        elif not value.is_integer():
+            return f'f{value!r}'.encode()
+
+    return f'i{int(value)}'.encode()
 
 
 @contextmanager
@@ -301,9 +1093,14 @@ def repr_as_default_yaml_representer():
     def default_representer(dumper, data):
         return dumper.represent_scalar('tag:yaml.org,2002:str', repr(data))
 
-    yaml.representer.SafeRepresenter.add_representer(None, default_representer)
+    # yaml.SafeDumper has its own registry once a yaml object is registered with it
+    previous = yaml.SafeDumper.yaml_representers.get(None)
+    yaml.SafeDumper.add_representer(None, default_representer)
 
     try:
         yield
     finally:
-        yaml.representer.SafeRepresenter.yaml_representers.pop(None)
+        if previous is None:
+            yaml.SafeDumper.yaml_representers.pop(None)
+        else:
+            yaml.SafeDumper.yaml_representers[None] = previous
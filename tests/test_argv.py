@@ -0,0 +1,77 @@
+import pytest
+
+from expfig.core._argv import ArgvEngine
+from expfig.core._schema import ArgumentSchema
+
+
+DEFAULT = {
+    'car': 'vroom',
+    'wheels': 4,
+    'truck': {'axles': 6.0, 'brands': ['toyota']},
+}
+
+
+@pytest.fixture
+def engine():
+    return ArgvEngine(ArgumentSchema.from_default(DEFAULT))
+
+
+class TestArgvEngine:
+    def test_empty(self, engine):
+        parsed = engine.parse([])
+
+        assert parsed.config_files == []
+        assert parsed.values == {}
+        assert parsed.unrecognized == []
+
+    def test_typed_values(self, engine):
+        parsed = engine.parse(['--wheels', '18', '--truck.axles=7.5', '--car', 'null'])
+
+        assert parsed.values == {'wheels': 18, 'truck.axles': 7.5, 'car': None}
+
+    def test_negative_number_value(self, engine):
+        parsed = engine.parse(['--wheels', '-1'])
+        assert parsed.values == {'wheels': -1}
+
+    def test_list_values(self, engine):
+        parsed = engine.parse(['--truck.brands', 'toyota', 'honda'])
+        assert parsed.values == {'truck.brands': ['toyota', 'honda']}
+
+    def test_list_literal(self, engine):
+        parsed = engine.parse(["--truck.brands=['toyota', 'honda']"])
+        assert parsed.values == {'truck.brands': ['toyota', 'honda']}
+
+    def test_config_files(self, engine):
+        parsed = engine.parse(['--wheels', '2', '--config', 'a.yaml', 'b.yaml', '--car', 'skirt'])
+
+        assert parsed.config_files == ['a.yaml', 'b.yaml']
+        assert parsed.values == {'wheels': 2, 'car': 'skirt'}
+        assert 'config' not in parsed.values
+
+    def test_multiple_config_args(self, engine):
+        with pytest.raises(TypeError, match='Multiple --config arguments'):
+            engine.parse(['--config', 'a.yaml', '--config', 'b.yaml'])
+
+    def test_verbose(self, engine):
+        parsed = engine.parse(['--verbose', '2'])
+        assert parsed.values == {'verbose': 2}
+
+    def test_unrecognized(self, engine):
+        parsed = engine.parse(['--whels', '18', '--car', 'skirt', 'extra'])
+
+        assert parsed.values == {'car': 'skirt'}
+        assert parsed.unrecognized == ['--whels', '18', 'extra']
+
+    def test_no_abbreviations(self, engine):
+        parsed = engine.parse(['--whe', '18'])
+
+        assert parsed.values == {}
+        assert parsed.unrecognized == ['--whe', '18']
+
+    def test_bad_type(self, engine):
+        with pytest.raises(SystemExit):
+            engine.parse(['--wheels', '7.5'])
+
+    def test_missing_value(self, engine):
+        with pytest.raises(SystemExit):
+            engine.parse(['--wheels'])
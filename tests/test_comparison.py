@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from expfig import Namespacify
+from expfig.functions import compare
+
+
+pd = pytest.importorskip('pandas')
+
+BASE = {
+    'truck': {'car': 'skirt', 'wheels': 18, 'axles': 6},
+    'dealer': 'michael-jordan-nissan'
+}
+
+
+def make(**updates):
+    ns = Namespacify(BASE)
+    for k, v in updates.items():
+        ns[tuple(k.split('__'))] = v
+
+    return ns
+
+
+class TestCompare:
+    def test_pairwise(self):
+        out = compare([make(), make(truck__car='bing', truck__wheels=4)])
+
+        assert list(out.columns) == ['0', '1']
+        assert list(out.index) == [('truck', 'car'), ('truck', 'wheels')]
+        assert out.loc[('truck', 'car')].tolist() == ['skirt', 'bing']
+        assert out.loc[('truck', 'wheels')].tolist() == [18, 4]
+
+    def test_named(self):
+        out = compare({'a': make(), 'b': make(dealer='michael-jordan-honda')})
+
+        assert list(out.columns) == ['a', 'b']
+        assert out.loc['dealer'].squeeze().tolist() == ['michael-jordan-nissan', 'michael-jordan-honda']
+
+    def test_same_value_different_keys(self):
+        out = compare([make(), make(truck__wheels=7, truck__axles=7)])
+
+        assert list(out.index) == [('truck', 'axles'), ('truck', 'wheels')]
+        assert out['1'].tolist() == [7, 7]
+
+    def test_missing_key(self):
+        extra = make()
+        extra['lease'] = True
+
+        out = compare([make(), extra])
+
+        assert list(out.index.get_level_values(0)) == ['lease']
+        assert np.isnan(out.loc['lease', '0']).all()
+        assert out.loc['lease', '1'].tolist() == [True]
+
+    def test_dotted_and_non_str_keys(self):
+        a = Namespacify({'k.dot': 1, 3: {'a': 1}, 'truck': {'car': 'skirt'}})
+        b = Namespacify({'k.dot': 2, 3: {'a': 2}, 'truck': {'car': 'skirt'}})
+
+        out = compare([a, b])
+
+        assert set(out.index.get_level_values(0)) == {'k.dot', 3}
+        assert out.loc[(3, 'a')].tolist() == [1, 2]
+        assert out.loc['k.dot'].squeeze().tolist() == [1, 2]
+        assert set(out.index) <= set(a.to_series().index)
+
+    def test_equal_numbers(self):
+        out = compare([make(truck__wheels=18), make(truck__wheels=18.0)])
+        assert out.empty
+
+    def test_base(self):
+        base = make(truck__axles=2)
+        out = compare([make(), make()], base=base)
+
+        assert list(out.index) == [('truck', 'axles')]
+        assert out.loc[('truck', 'axles')].tolist() == [6, 6]
+
+    def test_key_only_in_base(self):
+        base = make()
+        base['lease'] = True
+
+        assert compare([make(), make()], base=base).empty
+
+    def test_unhashable_values(self):
+        out = compare([make(brands=['toyota']), make(brands=['toyota']), make(brands=['honda'])])
+        assert out.squeeze().tolist() == [['toyota'], ['toyota'], ['honda']]
+
+        assert compare([make(brands=np.arange(3)), make(brands=np.arange(3))]).empty
+
+    def test_nan_always_differs(self):
+        out = compare([make(truck__wheels=float('nan'))])
+        assert list(out.index) == [('truck', 'wheels')]
+
+    def test_tolerance(self):
+        configs = [make(truck__wheels=18.0), make(truck__wheels=18.0 + 1e-6), make(truck__wheels=18.0 + 2e-6)]
+
+        out = compare(configs[:2], atol=1e-5)
+        assert out.empty
+
+        out = compare(configs, atol=1.5e-6)
+        assert out.loc[('truck', 'wheels')].tolist()[0] == 18.0
+        assert np.isnan(out.loc[('truck', 'wheels')].tolist()[1])
+        assert out.loc[('truck', 'wheels')].tolist()[2] == 18.0 + 2e-6
+
+    @pytest.mark.parametrize('workers', [0, 2])
+    def test_paths(self, tmp_path, workers):
+        paths = [
+            f"{make().serialize_to_dir(tmp_path / 'a')}/namespacify.yaml",
+            f"{make(truck__car='bing').serialize_to_dir(tmp_path / 'b')}/namespacify.yaml",
+        ]
+
+        out = compare(paths, workers=workers)
+        assert out.loc[('truck', 'car')].tolist() == ['skirt', 'bing']
+
+    def test_paths_in_process_by_default(self, tmp_path):
+        from unittest import mock
+        from expfig import namespacify
+
+        paths = [f"{make().serialize_to_dir(tmp_path / name)}/namespacify.yaml" for name in 'abc']
+
+        with mock.patch.object(namespacify, 'ProcessPoolExecutor') as mock_pool:
+            out = compare(paths)
+
+        mock_pool.assert_not_called()
+        assert out.empty
+
+    def test_invalid_path(self, tmp_path):
+        with pytest.raises(ValueError, match='Unable to load'):
+            compare([make(), tmp_path / 'missing.yaml'], workers=0)
@@ -66,6 +66,13 @@ class TestUnflatten:
         assert restructured == expected
 
 
+    def test_merge_dict_values(self):
+        contents = {'jeep.sound': 'vroom', 'jeep': {'wheels': 4}, 'truck': 'skirt', 'truck.wheels': 18}
+        restructured = unflatten(contents)
+
+        assert restructured == {'jeep': {'sound': 'vroom', 'wheels': 4}, 'truck': {'wheels': 18}}
+
+
 class TestFlatten:
     def test_single_key(self):
         nested = {'jeep': {'car': 'vroom'}}
@@ -173,3 +180,29 @@ class TestFlatten:
 
         flat = flatten(contents, levels=-1)
         assert flat == expected
+
+    def test_deep_max_levels_neg_2(self):
+        contents = {'a': {'b': {'c': {'d': 1}}, 'e': {'f': 2}}, 'g': 3}
+
+        expected = {
+            'a.b': {'c': {'d': 1}},
+            'a.e': {'f': 2},
+            'g': 3
+        }
+
+        flat = flatten(contents, levels=-2)
+        assert flat == expected
+
+    def test_nested_int_keys(self):
+        nested = {0: {1: 'vroom'}}
+
+        with pytest.warns(UserWarning):
+            unnested = flatten(nested)
+
+        assert unnested == {'0.1': 'vroom'}
+
+    def test_deep_keys(self):
+        key = '.'.join(f'k{j}' for j in range(5000))
+
+        nested = unflatten({key: 1})
+        assert flatten(nested) == {key: 1}
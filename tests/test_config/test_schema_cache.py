@@ -0,0 +1,74 @@
+import pytest
+
+from expfig import Config
+from expfig.core import schema_cache_info, clear_schema_cache
+from expfig.core._schema import get_schema, schema_digest
+
+from tests.test_config.test_simple import CONTENTS, NESTED_CONTENTS, mock_sys_argv
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
+class TestSchemaCache:
+    @mock_sys_argv()
+    def test_hit_on_same_default(self):
+        _ = Config(default=NESTED_CONTENTS)
+        assert schema_cache_info().misses == 1
+        assert schema_cache_info().hits == 0
+
+        _ = Config(default=NESTED_CONTENTS)
+        assert schema_cache_info().misses == 1
+        assert schema_cache_info().hits == 1
+        assert schema_cache_info().currsize == 1
+
+    @mock_sys_argv()
+    def test_miss_on_different_default(self):
+        _ = Config(default=NESTED_CONTENTS)
+        _ = Config(default=CONTENTS)
+
+        assert schema_cache_info().misses == 2
+        assert schema_cache_info().currsize == 2
+
+    def test_parser_reused(self):
+        assert get_schema(CONTENTS).parser is get_schema(CONTENTS).parser
+
+    def test_digest_ignores_values(self):
+        other = {**CONTENTS, 'car': 'skirt', 'wheels': 18}
+        assert schema_digest(CONTENTS) == schema_digest(other)
+
+    def test_digest_depends_on_types(self):
+        other = {**CONTENTS, 'wheels': 4.0}
+        assert schema_digest(CONTENTS) != schema_digest(other)
+
+    def test_cached_values_not_shared(self):
+        with mock_sys_argv('--truck.car', 'bing'):
+            config_1 = Config(default=NESTED_CONTENTS)
+
+        with mock_sys_argv():
+            config_2 = Config(default=NESTED_CONTENTS)
+
+        assert schema_cache_info().hits == 1
+        assert config_1.truck.car == 'bing'
+        assert config_2.truck.car == 'skirt'
+        assert config_2.sources.truck.car == 'DEFAULT'
+
+
+class TestConfigAccessor:
+    def test_accessor(self):
+        with mock_sys_argv('--truck.car', 'bing'):
+            config_1 = Config(default=NESTED_CONTENTS)
+
+        with mock_sys_argv():
+            config_2 = Config(default=NESTED_CONTENTS)
+
+        accessor_1, accessor_2 = config_1.to_accessor(), config_2.to_accessor()
+
+        assert accessor_1.truck.car == 'bing'
+        assert accessor_2.truck.car == 'skirt'
+        assert type(accessor_1) is type(accessor_2)
+        assert type(accessor_1).__name__ == 'ConfigAccessor'
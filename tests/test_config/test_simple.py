@@ -1,4 +1,5 @@
 import contextlib
+import numpy as np
 import os
 import sys
 import pytest
@@ -7,7 +8,7 @@ import yaml
 
 from copy import deepcopy
 from unittest import mock
-from expfig import Config
+from expfig import Config, Namespacify
 
 from tests.helpers.yaml_obj import InsuranceA, InsuranceB
 
@@ -378,6 +379,219 @@ class TestConfigFile:
             assert config.truck.car == 'skirt'
 
 
+class TestConfigSnapshot:
+    @mock_sys_argv('--truck.car', 'bing')
+    def test_snapshot_sources(self, tmp_path):
+        config = Config(default=NESTED_CONTENTS)
+        log_dir = config.serialize_to_dir(tmp_path / 'run', snapshot=True)
+
+        loaded = Namespacify.from_snapshot(f'{log_dir}/config.snapshot')
+
+        assert loaded == config
+        assert loaded.sources == config.sources
+        assert loaded.sources.truck.car == 'ARGV'
+
+
+class TestLazyConfig:
+    @mock_sys_argv('--truck.car', 'bing')
+    def test_deferred(self):
+        with mock.patch.object(Config, '_parse_config') as mock_parse:
+            _ = Config(default=NESTED_CONTENTS, lazy=True)
+
+        mock_parse.assert_not_called()
+
+    @mock_sys_argv('--truck.car', 'bing', '--dealer', 'michael-jordan-toyota')
+    def test_same_as_eager(self):
+        eager = Config(default=NESTED_CONTENTS)
+        lazy = Config(default=NESTED_CONTENTS, lazy=True)
+
+        assert lazy.truck.car == 'bing'
+        assert lazy == eager
+        assert lazy.default_config == eager.default_config
+        assert lazy.sources == eager.sources
+        assert lazy.all_sources == eager.all_sources
+
+    @mock_sys_argv('--truck.car', 'bing')
+    def test_sources_deferred(self):
+        from expfig.fig import SourceTracker
+
+        with mock.patch.object(SourceTracker, 'flush', autospec=True, side_effect=SourceTracker.flush) as mock_flush:
+            config = Config(default=NESTED_CONTENTS, lazy=True)
+            assert config.truck.car == 'bing'
+            mock_flush.assert_not_called()
+
+            assert config.sources.truck.car == 'ARGV'
+            mock_flush.assert_called_once()
+
+    @mock_sys_argv('--insured', 'not-bool')
+    def test_error_on_access(self):
+        config = Config(default=CONTENTS, lazy=True)
+
+        with pytest.raises(SystemExit):
+            _ = config.insured
+
+    @mock_sys_argv()
+    def test_copy(self):
+        config = Config(default=NESTED_CONTENTS, lazy=True)
+        copied = config.copy()
+
+        assert copied == Config(default=NESTED_CONTENTS)
+
+
+class TestValidation:
+    DEFAULT = {f'group_{j}': {f'value_{k}': float(k) for k in range(50)} for j in range(10)}
+    STALE = {f'group_{j}': {f'value_{k}': f'stale_{k}' for k in range(50)} for j in range(2)}
+
+    def test_valid(self):
+        config = Config(default=self.DEFAULT, argv=[])
+        assert config.validation_report.ok
+
+    def test_warn_single_record(self, caplog):
+        with tempfile(suffix='.yaml', mode='w') as temp_yaml, \
+                caplog.at_level('WARNING', logger='expfig.logging.logger'):
+            yaml.safe_dump(self.STALE, temp_yaml)
+            config = Config(default=self.DEFAULT, argv=['--config', temp_yaml.name], yaml_type_handling='warn')
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage().startswith('100 value(s)')
+        assert '... and 80 more.' in caplog.records[0].getMessage()
+
+        assert len(config.validation_report.invalid) == 100
+        assert config.group_0.value_1 == 'stale_1'
+
+    def test_error(self):
+        with tempfile(suffix='.yaml', mode='w') as temp_yaml:
+            yaml.safe_dump(self.STALE, temp_yaml)
+
+            with pytest.raises(TypeError, match='100 value'):
+                Config(default=self.DEFAULT, argv=['--config', temp_yaml.name], yaml_type_handling='error')
+
+    def test_ignore(self, caplog):
+        with tempfile(suffix='.yaml', mode='w') as temp_yaml, \
+                caplog.at_level('WARNING', logger='expfig.logging.logger'):
+            yaml.safe_dump(self.STALE, temp_yaml)
+            config = Config(default=self.DEFAULT, argv=['--config', temp_yaml.name], yaml_type_handling='ignore')
+
+        assert not caplog.records
+        assert len(config.validation_report) == 100
+
+    def test_missing_nested_key(self):
+        with tempfile(suffix='.yaml', mode='w') as temp_yaml:
+            yaml.safe_dump({'group_0': None}, temp_yaml)
+
+            with pytest.raises(RuntimeError, match='group_0.value_0'):
+                Config(default=self.DEFAULT, argv=['--config', temp_yaml.name])
+
+    def test_nested_key_replaced_by_section(self):
+        with tempfile(suffix='.yaml', mode='w') as temp_yaml:
+            yaml.safe_dump({'group_0': {'value_0': {'inner': 1.0}}}, temp_yaml)
+            config = Config(default=self.DEFAULT, argv=['--config', temp_yaml.name], yaml_type_handling='ignore')
+
+        assert not config.validation_report.missing
+        assert config.group_0.value_0.inner == 1.0
+
+
+class TestArrayArgument:
+    DEFAULT = {'model': {'weights': np.zeros((2, 2)), 'lr': 0.1}}
+
+    def test_default(self):
+        config = Config(default=self.DEFAULT, argv=[])
+
+        np.testing.assert_array_equal(config.model.weights, self.DEFAULT['model']['weights'])
+        assert config.model.weights is not self.DEFAULT['model']['weights']
+
+    def test_argv(self):
+        config = Config(default=self.DEFAULT, argv=['--model.weights', '1', '2', '3', '4', '5', '6'])
+
+        assert config.model.weights.dtype == np.float64
+        np.testing.assert_array_equal(config.model.weights, [[1, 2], [3, 4], [5, 6]])
+
+    def test_invalid_argv(self):
+        with pytest.raises(SystemExit):
+            Config(default=self.DEFAULT, argv=['--model.weights', '1', '2', '3'])
+
+    def test_serialize_round_trip(self, tmp_path):
+        config = Config(default=self.DEFAULT, argv=['--model.weights', *map(str, range(200))])
+        assert 'data' in config.serialize()
+
+        log_dir = config.serialize_to_dir(tmp_path / 'run')
+        loaded = Config(default=self.DEFAULT, argv=['--config', f'{log_dir}/config.yaml'])
+
+        np.testing.assert_array_equal(loaded.model.weights, config.model.weights)
+
+
+class TestExplicitArgv:
+    @mock_sys_argv('--truck.car', 'bing')
+    def test_explicit_argv_ignores_sys_argv(self):
+        config = Config(default=NESTED_CONTENTS, argv=['--truck.car', 'bong'])
+
+        assert config.truck.car == 'bong'
+        assert config.sources.truck.car == 'ARGV'
+
+    @mock_sys_argv('--truck.car', 'bing')
+    def test_empty_argv(self):
+        config = Config(default=NESTED_CONTENTS, argv=[])
+
+        assert config.truck.car == NESTED_CONTENTS['truck']['car']
+
+    def test_lazy_captures_argv(self):
+        with mock_sys_argv('--truck.car', 'bing'):
+            config = Config(default=NESTED_CONTENTS, lazy=True)
+
+        with mock_sys_argv('--truck.car', 'bong'):
+            assert config.truck.car == 'bing'
+
+    def test_from_argvs(self):
+        argvs = [['--truck.car', f'car_{j}'] for j in range(8)]
+        configs = Config.from_argvs(argvs, default=NESTED_CONTENTS, workers=4)
+
+        assert [c.truck.car for c in configs] == [f'car_{j}' for j in range(8)]
+        assert all(c.default_config is configs[0].default_config for c in configs)
+
+    def test_from_argvs_serial_same_as_threaded(self):
+        argvs = [['--truck.car', 'bing'], ['--dealer', 'michael-jordan-toyota'], []]
+
+        serial = Config.from_argvs(argvs, default=NESTED_CONTENTS, workers=0)
+        threaded = Config.from_argvs(argvs, default=NESTED_CONTENTS)
+
+        assert serial == threaded
+        assert [c.sources for c in serial] == [c.sources for c in threaded]
+
+
+class TestLayeredConfig:
+    @mock_sys_argv()
+    def test_mutable_leaves_not_shared(self):
+        default = {**YAML_CONTENTS, 'brands': ['toyota']}
+        config = Config(default=default)
+
+        assert config.brands == config.default_config.brands
+        assert config.brands is not config.default_config.brands
+        assert config.insurance is not config.default_config.insurance
+
+        config.brands.append('honda')
+        assert config.default_config.brands == ['toyota']
+
+    @mock_sys_argv()
+    def test_immutable_leaves_shared(self):
+        default = {'car': 'vroom' * 1000}
+        config = Config(default=default)
+
+        assert config.car is config.default_config.car
+
+    @mock_sys_argv('--truck.car', 'bing')
+    def test_sources_from_layers(self):
+        with tempfile(suffix='.yaml', mode='w') as temp_yaml:
+            yaml.safe_dump({'truck': {'wheels': 20}}, temp_yaml)
+            temp_yaml.close()
+
+            config = Config(default=NESTED_CONTENTS, config=[temp_yaml.name, {'dealer': 'michael-jordan-honda'}])
+
+        assert config.sources.truck.car == 'ARGV'
+        assert config.sources.truck.wheels == temp_yaml.name
+        assert config.sources.truck.axles == 'DEFAULT'
+        assert config.sources.dealer == 'CONFIG-SDK'
+
+
 @contextlib.contextmanager
 def tempfile(mode='w+b', buffering=-1, encoding=None,
              newline=None, suffix=None, prefix=None,
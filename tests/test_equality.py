@@ -0,0 +1,89 @@
+import numpy as np
+
+from unittest import mock
+
+from expfig.core import _equality
+from expfig.core._equality import equal
+
+
+def read_only(arr):
+    arr.flags.writeable = False
+    return arr
+
+
+def bytes_backed(arr):
+    return np.frombuffer(arr.tobytes(), dtype=arr.dtype).reshape(arr.shape)
+
+
+class TestEqual:
+    def test_scalars(self):
+        assert equal(1, 1.0)
+        assert equal('a', 'a')
+        assert not equal(1, 2)
+        assert not equal(float('nan'), float('nan'))
+
+        nan = float('nan')
+        assert not equal(nan, nan)
+
+    def test_arrays(self):
+        assert equal(np.arange(3), np.arange(3))
+        assert equal(np.arange(3), np.arange(3.))
+        assert equal(np.arange(3), [0, 1, 2])
+        assert not equal(np.arange(3), np.arange(4))
+        assert not equal(np.arange(3), np.array(['0', '1', '2']))
+        assert not equal(np.array([np.nan]), np.array([np.nan]))
+
+    def test_shape_mismatch_short_circuits(self):
+        with mock.patch.object(np, 'array_equal') as mock_array_equal:
+            assert not equal(np.zeros((2, 3)), np.zeros((3, 2)))
+
+        mock_array_equal.assert_not_called()
+
+    def test_immutable_digest_cached(self):
+        a, b = bytes_backed(np.arange(1000)), bytes_backed(np.arange(1000))
+
+        with mock.patch.object(_equality, '_compute_array_digest', wraps=_equality._compute_array_digest) as m:
+            assert equal(a, b)
+            assert equal(a, b)
+
+        assert m.call_count == 2
+
+        with mock.patch.object(np, 'array_equal') as mock_array_equal:
+            assert not equal(a, bytes_backed(np.arange(1, 1001)))
+
+        mock_array_equal.assert_not_called()
+
+    def test_memmap_digest_cached(self, tmp_path):
+        np.save(tmp_path / 'arr.npy', np.arange(1000))
+        a = np.load(tmp_path / 'arr.npy', mmap_mode='r')
+
+        assert _equality._has_immutable_buffer(a)
+        assert _equality._has_immutable_buffer(a[10:])
+
+    def test_read_only_digest_not_cached(self):
+        a, b = read_only(np.arange(1000)), read_only(np.arange(1000))
+        assert equal(a, b)
+
+        b.flags.writeable = True
+        b[0] = 100
+        b.flags.writeable = False
+
+        assert not equal(a, b)
+
+        view = read_only(np.arange(1000).view())
+        assert not _equality._has_immutable_buffer(view)
+
+    def test_read_only_float_digest_mismatch_compares_values(self):
+        assert equal(read_only(np.array([0.0])), read_only(np.array([-0.0])))
+
+    def test_tolerance(self):
+        assert not equal(1.0, 1.0 + 1e-9)
+        assert equal(1.0, 1.0 + 1e-9, atol=1e-8)
+        assert equal(100.0, 100.1, rtol=1e-2)
+        assert not equal(100.0, 102.0, rtol=1e-2)
+        assert equal(float('inf'), float('inf'), atol=1e-8)
+        assert not equal(float('nan'), float('nan'), atol=1e-8)
+        assert not equal('a', 'b', atol=1)
+
+        assert equal(np.ones(3), np.ones(3) + 1e-9, atol=1e-8)
+        assert not equal(np.ones(3), np.ones(3) + 1e-9)
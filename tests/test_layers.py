@@ -0,0 +1,56 @@
+from expfig.core._layers import ConfigLayers
+
+
+DEFAULT = {
+    'truck': {'wheels': 4, 'brand': 'toyota'},
+    'dealer': 'michael-jordan-nissan'
+}
+
+
+class TestConfigLayers:
+    def test_single_layer(self):
+        layers = ConfigLayers()
+        layers.push('DEFAULT', DEFAULT)
+
+        assert layers.leaves() == {'truck.wheels': 4, 'truck.brand': 'toyota', 'dealer': 'michael-jordan-nissan'}
+        assert layers.sources() == {'truck': {'wheels': 'DEFAULT', 'brand': 'DEFAULT'}, 'dealer': 'DEFAULT'}
+
+    def test_nested_override(self):
+        layers = ConfigLayers()
+        layers.push('DEFAULT', DEFAULT)
+        layers.push('ARGV', {'truck': {'brand': 'honda'}})
+
+        assert layers.leaves() == {'truck.wheels': 4, 'truck.brand': 'honda', 'dealer': 'michael-jordan-nissan'}
+        assert layers.sources()['truck'] == {'wheels': 'DEFAULT', 'brand': 'ARGV'}
+
+    def test_new_keys_appended(self):
+        layers = ConfigLayers()
+        layers.push('DEFAULT', DEFAULT)
+        layers.push('file.yaml', {'truck': {'axles': 6}, 'lease': False})
+
+        assert list(layers.leaves()) == ['truck.wheels', 'truck.brand', 'truck.axles', 'dealer', 'lease']
+
+    def test_leaf_shadows_subtree(self):
+        layers = ConfigLayers()
+        layers.push('DEFAULT', DEFAULT)
+        layers.push('file.yaml', {'truck': None})
+        layers.push('ARGV', {'truck': {'brand': 'honda'}})
+
+        assert layers.leaves() == {'truck.brand': 'honda', 'dealer': 'michael-jordan-nissan'}
+
+    def test_empty_dict_leaf(self):
+        layers = ConfigLayers()
+        layers.push('DEFAULT', {'extras': {}})
+
+        assert layers.leaves() == {'extras': {}}
+
+    def test_layers_not_modified(self):
+        upper = {'truck': {'brand': 'honda'}}
+
+        layers = ConfigLayers()
+        layers.push('DEFAULT', DEFAULT)
+        layers.push('ARGV', upper)
+        _ = layers.leaves(), layers.sources()
+
+        assert DEFAULT['truck'] == {'wheels': 4, 'brand': 'toyota'}
+        assert upper == {'truck': {'brand': 'honda'}}
@@ -0,0 +1,193 @@
+import numpy as np
+import os
+import pickle
+import pytest
+import warnings
+import yaml
+
+from copy import deepcopy
+from unittest import mock
+
+from expfig import Config, Namespacify
+from expfig.core import ArrayRef, _load_yaml
+from expfig.core._load_yaml import SafeLoader, dump_yaml, load_yaml, load_yaml_file, clear_yaml_cache
+from tests.helpers.yaml_obj import InsuranceA
+
+
+CONTENTS = {
+    'car': 'vroom',
+    'brands': ['toyota', 'honda'],
+    'insurance': InsuranceA(value=10)
+}
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    clear_yaml_cache()
+
+    path = tmp_path / 'config.yaml'
+    path.write_text(yaml.safe_dump(CONTENTS))
+
+    yield path
+
+    clear_yaml_cache()
+
+
+class TestLoadYaml:
+    def test_uses_libyaml(self):
+        if yaml.__with_libyaml__:
+            assert issubclass(SafeLoader, yaml.CSafeLoader)
+        else:
+            assert issubclass(SafeLoader, yaml.SafeLoader)
+
+    def test_yaml_object(self):
+        loaded = load_yaml(yaml.safe_dump(CONTENTS))
+        assert loaded == CONTENTS
+
+
+class TestLoadYamlFile:
+    def test_load(self, yaml_file):
+        assert load_yaml_file(yaml_file) == CONTENTS
+
+    def test_cached(self, yaml_file):
+        loaded_1 = load_yaml_file(yaml_file)
+
+        with mock.patch.object(_load_yaml, 'load_yaml') as mock_load:
+            loaded_2 = load_yaml_file(yaml_file)
+
+        mock_load.assert_not_called()
+        assert loaded_1 == loaded_2
+
+    def test_cached_copies(self, yaml_file):
+        loaded_1 = load_yaml_file(yaml_file)
+        loaded_1['brands'].append('nissan')
+        loaded_1['insurance'].value = 20
+
+        loaded_2 = load_yaml_file(yaml_file)
+
+        assert loaded_2 == CONTENTS
+        assert loaded_2['car'] is loaded_1['car']
+
+    def test_reload_modified(self, yaml_file):
+        _ = load_yaml_file(yaml_file)
+
+        yaml_file.write_text(yaml.safe_dump({**CONTENTS, 'car': 'skirt!'}))
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        assert load_yaml_file(yaml_file)['car'] == 'skirt!'
+
+
+class TestNdarray:
+    @pytest.mark.parametrize('arr', (
+        np.arange(6, dtype=np.int32).reshape(2, 3),
+        np.linspace(0, 1, 1000),
+        np.array(3.5),
+        np.zeros((0, 2), dtype=np.float32),
+    ))
+    def test_round_trip(self, arr):
+        loaded = load_yaml(dump_yaml({'arr': arr}))['arr']
+
+        assert loaded.dtype == arr.dtype
+        np.testing.assert_array_equal(loaded, arr)
+
+    def test_compact(self):
+        dumped = dump_yaml({'arr': np.linspace(0, 1, 1000)})
+
+        assert dumped.startswith('arr: !ndarray')
+        assert dumped.count('\n') < 200
+
+    def test_serialize(self):
+        ns = Namespacify({'arr': np.arange(3)})
+
+        assert ns.serialize().startswith('arr: !ndarray')
+        np.testing.assert_array_equal(load_yaml(ns.serialize())['arr'], ns.arr)
+
+    def test_pprint_repr(self):
+        arr = np.arange(3)
+        printed = Namespacify({'arr': arr, 'obj': object}).pprint(log_func=lambda _: None)
+
+        assert '!ndarray' not in printed
+        assert repr(arr) in printed
+        assert repr(object) in printed
+
+        with pytest.raises(yaml.representer.RepresenterError):
+            yaml.safe_dump({'arr': arr})
+
+
+class TestArrayRef:
+    @pytest.fixture
+    def npy_file(self, tmp_path):
+        path = tmp_path / 'table.npy'
+        np.save(path, np.arange(1000, dtype=np.float32))
+        return path
+
+    def test_load_lazy(self, npy_file):
+        ref = load_yaml(f'table: !array {npy_file}')['table']
+
+        assert isinstance(ref, ArrayRef)
+        assert ref._array is None
+
+        assert ref.shape == (1000, )
+        assert isinstance(ref.array, np.memmap)
+        assert not ref.array.flags.writeable
+        np.testing.assert_array_equal(ref[:3], [0, 1, 2])
+        np.testing.assert_array_equal(np.asarray(ref), np.arange(1000))
+
+    def test_copies_shared(self, npy_file):
+        ns = Namespacify({'model': {'table': ArrayRef(npy_file)}})
+        _ = ns.model.table.array
+
+        assert ns.deepcopy().model.table is ns.model.table
+        assert deepcopy(ns).model.table.array is ns.model.table.array
+
+    def test_serialized_as_reference(self, npy_file):
+        ref = ArrayRef(npy_file)
+        _ = ref.array
+
+        dumped = yaml.safe_dump({'table': ref})
+        assert dumped.count('\n') == 1
+
+        assert load_yaml(dumped)['table'] == ref
+        assert pickle.loads(pickle.dumps(ref)) == ref
+
+    def test_config_argv(self, npy_file, tmp_path):
+        other = tmp_path / 'other.npy'
+        np.save(other, np.ones(3))
+
+        config = Config(default={'table': ArrayRef(npy_file)}, argv=['--table', f'!array {other}'])
+
+        assert config.table == ArrayRef(other)
+        np.testing.assert_array_equal(config.table, np.ones(3))
+
+    def test_array_protocol(self, npy_file):
+        ref = ArrayRef(npy_file)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+
+            assert np.shares_memory(np.asarray(ref), ref.array)
+            assert np.asarray(ref, dtype=np.float64).dtype == np.float64
+
+            copied = np.array(ref, copy=True)
+            assert copied.flags.writeable and not np.shares_memory(copied, ref.array)
+
+        with pytest.raises(ValueError):
+            np.array(ref, dtype=np.float64, copy=False)
+
+    def test_relative_to_yaml_file(self, npy_file, tmp_path, monkeypatch):
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text(f'table: !array {npy_file.name}')
+        monkeypatch.chdir(npy_file.anchor)
+
+        ref = load_yaml_file(config_file)['table']
+
+        assert ref == ArrayRef(npy_file)
+        np.testing.assert_array_equal(ref[:3], [0, 1, 2])
+
+    def test_relative_to_cwd(self, npy_file, monkeypatch):
+        monkeypatch.chdir(npy_file.parent)
+        ref = load_yaml(f'table: !array {npy_file.name}')['table']
+
+        assert ref.path == npy_file.name
+        np.testing.assert_array_equal(ref[:3], [0, 1, 2])
@@ -200,6 +200,26 @@ class TestNestNamespacify:
         ns = Namespacify(dict())
         assert ns.to_series().empty
 
+    @pytest.mark.skipif(not isinstance(pd, ModuleType), reason='pandas is not installed')
+    def test_to_series_single_leaf(self):
+        series = Namespacify({'truck': {'car': 'skirt'}}).to_series()
+        assert series.loc[('truck', 'car')] == 'skirt'
+
+    @pytest.mark.skipif(not isinstance(pd, ModuleType), reason='pandas is not installed')
+    def test_to_series_dotted_key(self):
+        series = Namespacify({'truck': {'car.brand': 'toyota'}}).to_series()
+        assert list(series.index) == [('truck', 'car.brand')]
+
+    @pytest.mark.skipif(not isinstance(pd, ModuleType), reason='pandas is not installed')
+    def test_to_frame(self):
+        other = {**NESTED_CONTENTS, 'truck': {**NESTED_CONTENTS['truck'], 'car': 'bing'}}
+        frame = Namespacify.to_frame({'a': Namespacify(NESTED_CONTENTS), 'b': other})
+
+        assert list(frame.index) == ['a', 'b']
+        assert frame.loc['a'].equals(Namespacify(NESTED_CONTENTS).to_series().rename('a'))
+        assert frame[('truck', 'car')].tolist() == ['skirt', 'bing']
+        assert frame[('truck', 'wheels')].dtype == np.int64
+
     def test_to_dict(self):
         ns = Namespacify(NESTED_CONTENTS)
         d = ns.to_dict()
@@ -342,3 +362,575 @@ class TestSymmetricDifference:
         sym_diff = ns1.symmetric_difference(ns2)
 
         assert np.array_equal(sym_diff['car'], ns1['car'])
+
+
+class TestPathIndex:
+    def test_tuple_and_dotted_get(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+
+        assert ns['truck', 'car'] == 'skirt'
+        assert ns['truck.car'] == 'skirt'
+        assert ns[('jeep', )] == ns['jeep']
+
+    def test_missing_path(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+
+        with pytest.raises(KeyError):
+            _ = ns['truck', 'color']
+
+        with pytest.raises(KeyError):
+            _ = ns['truck.color']
+
+    def test_literal_dotted_key(self):
+        ns = Namespacify({**NESTED_CONTENTS, 'truck.car': 'literal'}).index_paths()
+        assert ns['truck.car'] == 'literal'
+
+    def test_slice_get(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        assert ns[:, 'car'] == {'jeep': 'vroom', 'truck': 'skirt'}
+
+    def test_setitem_tuple_updates_index(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        ns[('truck', 'axles')] = 32
+        ns[('bike', 'brand')] = 'honda'
+
+        assert ns['truck.axles'] == 32
+        assert ns['bike', 'brand'] == 'honda'
+        assert ns._path_index == ns._build_path_index()
+
+    def test_child_write_updates_index(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        ns.truck.car = 'bing'
+
+        assert ns['truck', 'car'] == 'bing'
+        assert ns['truck.car'] == 'bing'
+
+    def test_replace_subtree_updates_index(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        ns['jeep'] = 'missing'
+
+        assert ns['jeep'] == 'missing'
+
+        with pytest.raises(KeyError):
+            _ = ns['jeep.car']
+
+        assert ns._path_index == ns._build_path_index()
+
+    def test_delete_updates_index(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        del ns.truck['car']
+
+        with pytest.raises(KeyError):
+            _ = ns['truck', 'car']
+
+        assert ns._path_index == ns._build_path_index()
+
+    def test_detached_child_does_not_update_index(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        truck = ns.truck
+        ns['truck'] = Namespacify({'car': 'new'})
+
+        truck['car'] = 'detached'
+        assert ns['truck.car'] == 'new'
+
+    def test_copy(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        copied = ns.copy()
+        copied[('truck', 'car')] = 'bing'
+
+        assert copied['truck.car'] == 'bing'
+        assert copied._path_index == copied._build_path_index()
+
+    def test_shallow_copy_child_write(self):
+        from copy import copy
+
+        ns = Namespacify({'a': {'b': 1, 'c': 2}, 'x': 3}).index_paths()
+        copied = copy(ns)
+        copied['a']['b'] = 99
+
+        assert copied['a', 'b'] == copied['a.b'] == copied.a.b == 99
+        assert ns['a', 'b'] == ns['a.b'] == ns.a.b == 1
+
+    def test_pickle(self):
+        import pickle
+
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        loaded = pickle.loads(pickle.dumps(ns))
+        loaded.truck.car = 'bing'
+
+        assert loaded['truck.car'] == 'bing'
+
+
+class TestAccessor:
+    def test_attribute_access(self):
+        accessor = Namespacify(NESTED_CONTENTS).to_accessor()
+
+        assert accessor.truck.car == 'skirt'
+        assert accessor.jeep.wheels == 4
+        assert not hasattr(accessor, '__dict__')
+
+    def test_round_trip(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        accessor = ns.to_accessor()
+
+        assert accessor.to_dict() == NESTED_CONTENTS
+        assert accessor.to_namespacify() == ns
+        assert Namespacify.from_accessor(accessor) == ns
+
+    def test_class_cached_by_structure(self):
+        other_contents = deepcopy(NESTED_CONTENTS)
+        other_contents['truck']['car'] = 'bing'
+
+        accessor_1 = Namespacify(NESTED_CONTENTS).to_accessor()
+        accessor_2 = Namespacify(other_contents).to_accessor()
+
+        assert type(accessor_1) is type(accessor_2)
+        assert accessor_1 != accessor_2
+
+    def test_class_depends_on_types(self):
+        other_contents = deepcopy(NESTED_CONTENTS)
+        other_contents['truck']['axles'] = 6.0
+
+        accessor_1 = Namespacify(NESTED_CONTENTS).to_accessor()
+        accessor_2 = Namespacify(other_contents).to_accessor()
+
+        assert type(accessor_1) is not type(accessor_2)
+        assert type(accessor_2.truck).__annotations__['axles'] is float
+
+    def test_non_attribute_keys(self):
+        contents = {**CONTENTS, 0: 'zero', 'class': 'sedan', 'to_dict': 'yes', 'a.b': 1}
+        accessor = Namespacify(contents).to_accessor()
+
+        assert accessor.car == 'vroom'
+        assert accessor.to_dict() == contents
+
+
+class TestTolerance:
+    def test_set_operations(self):
+        a = Namespacify({**NESTED_CONTENTS, 'metrics': {'loss': 0.5, 'weights': np.ones(3)}})
+        b = Namespacify({**NESTED_CONTENTS, 'metrics': {'loss': 0.5 + 1e-9, 'weights': np.ones(3) - 1e-9}})
+
+        assert (a - b) == Namespacify({'metrics': {'loss': 0.5, 'weights': a.metrics.weights}})
+        assert not a.difference(b, atol=1e-6)
+        assert not a.symmetric_difference(b, atol=1e-6)
+        assert a.intersection(b, atol=1e-6).keys() == a.keys()
+
+    def test_array_leaves(self):
+        a = Namespacify({'truck': {'weights': np.arange(3), 'car': 'skirt'}})
+        b = Namespacify({'truck': {'weights': np.arange(3), 'car': 'bing'}})
+
+        assert (a - b) == Namespacify({'truck': {'car': 'skirt'}})
+
+
+class TestPatch:
+    def other(self):
+        return Namespacify({
+            'jeep': {'car': 'vroom', 'wheels': 4},
+            'truck': 'bing',
+            'dealer': {'name': 'michael-jordan-nissan'}
+        })
+
+    def test_diff(self):
+        from expfig.core import Patch
+
+        patch = Namespacify(NESTED_CONTENTS).diff(self.other())
+
+        assert patch == Patch([
+            ('delete', ('jeep', 'axles')),
+            ('replace', ('truck', ), 'bing'),
+            ('set', ('dealer', ), {'name': 'michael-jordan-nissan'}),
+        ])
+
+    def test_no_diff(self):
+        assert not Namespacify(NESTED_CONTENTS).diff(NESTED_CONTENTS)
+
+    def test_apply(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        out = ns.apply_patch(ns.diff(self.other()))
+
+        assert out is ns
+        assert ns == self.other()
+        assert isinstance(ns.dealer, Namespacify)
+
+    def test_apply_touches_only_patched_nodes(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        jeep, truck = ns.jeep, ns.truck
+
+        other = Namespacify(NESTED_CONTENTS)
+        other.truck.car = 'bing'
+        ns.apply_patch(ns.diff(other))
+
+        assert ns.jeep is jeep and ns.truck is truck
+        assert ns.truck.car == 'bing'
+
+    def test_apply_keeps_caches_consistent(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        digest = ns._digest()
+
+        ns.apply_patch(ns.diff(self.other()))
+
+        assert ns['dealer.name'] == 'michael-jordan-nissan'
+        assert 'jeep.axles' not in ns._path_index
+        assert ns._digest() != digest
+        assert ns._digest() == self.other()._digest()
+
+    def test_serialize_round_trip(self):
+        from expfig.core import Patch
+
+        patch = Namespacify(NESTED_CONTENTS).diff(self.other())
+        loaded = Patch.deserialize(patch.serialize())
+
+        assert loaded == patch
+        assert Namespacify(NESTED_CONTENTS).apply_patch(loaded) == self.other()
+        assert Namespacify(NESTED_CONTENTS).apply_patch(patch.to_list()) == self.other()
+
+    def test_invalid_patch(self):
+        from expfig.core import Patch
+
+        ns = Namespacify(NESTED_CONTENTS)
+
+        with pytest.raises(KeyError, match='exists'):
+            ns.apply_patch(Patch([('set', ('truck', 'car'), 'bing')]))
+
+        with pytest.raises(KeyError, match='does not exist'):
+            ns.apply_patch(Patch([('replace', ('truck', 'color'), 'red')]))
+
+        with pytest.raises(ValueError):
+            Patch([('move', ('truck', ), 'jeep')])
+
+    def test_delete_tuple_path(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        del ns['truck', 'car']
+
+        assert 'car' not in ns.truck
+
+        with pytest.raises(KeyError):
+            del ns['truck', 'car']
+
+
+class TestFromYamlMany:
+    @pytest.mark.parametrize('workers', [0, 2])
+    def test_in_order(self, tmp_path, workers):
+        namespacifys = [Namespacify({**NESTED_CONTENTS, 'run': j}) for j in range(6)]
+        paths = [f"{ns.serialize_to_dir(tmp_path / f'run_{ns.run}')}/namespacify.yaml" for ns in namespacifys]
+
+        loaded = Namespacify.from_yaml_many(paths, workers=workers)
+        assert loaded == namespacifys
+
+    @pytest.mark.parametrize('workers', [0, 2])
+    def test_errors_in_place(self, tmp_path, workers):
+        valid = f"{Namespacify(NESTED_CONTENTS).serialize_to_dir(tmp_path / 'run')}/namespacify.yaml"
+        invalid = tmp_path / 'invalid.yaml'
+        invalid.write_text('truck: [1')
+
+        loaded = Namespacify.from_yaml_many([valid, tmp_path / 'missing.yaml', invalid, valid], workers=workers)
+
+        assert loaded[0] == loaded[3] == Namespacify(NESTED_CONTENTS)
+        assert isinstance(loaded[1], FileNotFoundError)
+        assert isinstance(loaded[2], yaml.YAMLError)
+
+
+class TestSnapshot:
+    def test_round_trip(self, tmp_path):
+        ns = Namespacify({**NESTED_CONTENTS, 'insurance': InsuranceA(value=10), 'features': ('a', 'b')})
+        log_dir = ns.serialize_to_dir(tmp_path / 'run', snapshot=True)
+
+        assert (tmp_path / 'run' / 'namespacify.snapshot').exists()
+
+        loaded = Namespacify.from_snapshot(f'{log_dir}/namespacify.snapshot')
+        assert loaded == Namespacify.from_yaml(f'{log_dir}/namespacify.yaml')
+        assert loaded.insurance == InsuranceA(value=10)
+        assert loaded.features == ['a', 'b']
+
+    def test_numpy_scalars(self, tmp_path):
+        ns = Namespacify({'lr': np.float64(1.5e-3), 'steps': np.int64(10), 'flag': np.bool_(True)})
+        log_dir = ns.serialize_to_dir(tmp_path / 'run', snapshot=True)
+
+        loaded = Namespacify.from_snapshot(f'{log_dir}/namespacify.snapshot')
+        assert loaded == Namespacify.from_yaml(f'{log_dir}/namespacify.yaml') == ns
+        assert type(loaded.lr) is float and loaded.lr == 1.5e-3
+        assert type(loaded.steps) is int and loaded.steps == 10
+        assert loaded.flag is True
+
+    def test_numpy_scalar_keys(self, tmp_path):
+        from expfig.core._snapshot import read_snapshot, write_snapshot
+
+        write_snapshot(tmp_path / 'data.snapshot', {np.int64(3): 'a', 'b': {np.float64(0.5): 1}})
+        data, _ = read_snapshot(tmp_path / 'data.snapshot')
+
+        assert data == {3: 'a', 'b': {0.5: 1}}
+        assert type(next(iter(data))) is int
+
+    def test_from_yaml_uses_snapshot(self, tmp_path):
+        from unittest import mock
+        from expfig import namespacify
+
+        ns = Namespacify(NESTED_CONTENTS)
+        log_dir = ns.serialize_to_dir(tmp_path / 'run', snapshot=True)
+
+        with mock.patch.object(namespacify, 'load_yaml_file') as mock_load:
+            loaded = Namespacify.from_yaml(f'{log_dir}/namespacify.yaml')
+
+        mock_load.assert_not_called()
+        assert loaded == ns
+
+    def test_from_yaml_ignores_stale_snapshot(self, tmp_path):
+        import os
+
+        ns = Namespacify(NESTED_CONTENTS)
+        log_dir = ns.serialize_to_dir(tmp_path / 'run', snapshot=True)
+        yaml_file = f'{log_dir}/namespacify.yaml'
+
+        with open(yaml_file, 'w') as f:
+            Namespacify({**NESTED_CONTENTS, 'jeep': 'edited'}).serialize(f)
+
+        stat = os.stat(yaml_file)
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        assert Namespacify.from_yaml(yaml_file).jeep == 'edited'
+
+    def test_invalid_snapshot_ignored(self, tmp_path):
+        ns = Namespacify(NESTED_CONTENTS)
+        log_dir = ns.serialize_to_dir(tmp_path / 'run')
+
+        with open(f'{log_dir}/namespacify.snapshot', 'wb') as f:
+            f.write(b'not a snapshot')
+
+        assert Namespacify.from_yaml(f'{log_dir}/namespacify.yaml') == ns
+
+
+class TestDeepcopy:
+    def test_equal_and_independent(self):
+        ns = Namespacify({**NESTED_CONTENTS, 'brands': ['toyota'], 'insurance': InsuranceA(value=10)})
+        copied = deepcopy(ns)
+
+        assert copied == ns
+        assert copied.truck is not ns.truck
+        assert copied.brands is not ns.brands
+        assert copied.insurance is not ns.insurance
+
+        copied.truck.car = 'bing'
+        copied.brands.append('honda')
+
+        assert ns.truck.car == 'skirt'
+        assert ns.brands == ['toyota']
+
+    def test_immutable_leaves_shared(self):
+        frozen = np.frombuffer(np.arange(3).tobytes(), dtype=int)
+
+        ns = Namespacify({'car': 'vroom' * 100, 'features': ('a', 'b'), 'frozen': frozen})
+        copied = deepcopy(ns)
+
+        assert copied.car is ns.car
+        assert copied.features is ns.features
+        assert copied.frozen is ns.frozen
+
+    def test_read_only_flag_copied(self):
+        ns = Namespacify({'ro': np.arange(3)})
+        ns.ro.flags.writeable = False
+
+        copied = deepcopy(ns)
+        ns.ro.flags.writeable = True
+        ns.ro[0] = 99
+
+        assert copied.ro is not ns.ro
+        np.testing.assert_array_equal(copied.ro, [0, 1, 2])
+
+    def test_read_only_view_copied(self):
+        base = np.arange(3)
+        view = base.view()
+        view.flags.writeable = False
+
+        ns = Namespacify({'view': view})
+        copied = deepcopy(ns)
+        base[0] = 10
+
+        assert copied.view is not ns.view
+        np.testing.assert_array_equal(copied.view, [0, 1, 2])
+
+    def test_array_copied(self):
+        ns = Namespacify({'weights': np.arange(5.)})
+        copied = deepcopy(ns)
+
+        assert copied.weights is not ns.weights
+        assert np.shares_memory(copied.weights, ns.weights) is False
+        np.testing.assert_array_equal(copied.weights, ns.weights)
+
+    def test_memo_shared_leaf(self):
+        brands = ['toyota']
+        ns = Namespacify({'jeep': {'brands': brands}, 'truck': {'brands': brands}})
+        copied = deepcopy(ns)
+
+        assert copied.jeep.brands is copied.truck.brands
+        assert copied.jeep.brands is not brands
+
+    def test_memo_cycle(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        ns['insurance'] = InsuranceA(value=ns)
+
+        copied = deepcopy(ns)
+        assert copied.insurance.value is copied
+
+    def test_structure_only(self):
+        ns = Namespacify({**NESTED_CONTENTS, 'brands': ['toyota']})
+        copied = ns.deepcopy(deepcopy_leaves=False)
+
+        assert copied == ns
+        assert copied.truck is not ns.truck
+        assert copied.brands is ns.brands
+
+    def test_keeps_path_index(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        copied = deepcopy(ns)
+
+        copied.truck.car = 'bing'
+        assert copied['truck.car'] == 'bing'
+        assert ns['truck.car'] == 'skirt'
+
+
+class TestDigest:
+    def test_equal_digests(self):
+        a = Namespacify(NESTED_CONTENTS)
+        b = Namespacify({'truck': dict(reversed(list(NESTED_CONTENTS['truck'].items()))), 'jeep': CONTENTS})
+
+        assert a._digest() is not None
+        assert a._digest() == b._digest()
+
+    def test_canonical_numbers(self):
+        digests = {Namespacify({'a': v})._digest() for v in (1, 1.0, True, np.int64(1), np.float32(1.0), 1 + 0j)}
+        assert len(digests) == 1
+
+        assert Namespacify({'a': 1.5})._digest() != Namespacify({'a': 1})._digest()
+        assert Namespacify({'a': '1'})._digest() != Namespacify({'a': 1})._digest()
+
+    def test_unknown_digest(self):
+        for leaf in (float('nan'), ['toyota'], np.arange(3), InsuranceA(value=10)):
+            assert Namespacify({'truck': {'leaf': leaf}})._digest() is None
+
+    def test_invalidated_on_mutation(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        digest = ns._digest()
+
+        ns.truck.car = 'bing'
+        assert ns._digest() != digest
+
+        ns.truck.car = 'skirt'
+        assert ns._digest() == digest
+
+        del ns.truck['car']
+        assert ns._digest() != digest
+
+    def test_shared_child_not_cached(self):
+        from copy import copy
+
+        ns = Namespacify(NESTED_CONTENTS)
+        copied = copy(ns)
+        digest = copied._digest()
+
+        ns.truck.car = 'bing'
+        assert copied._digest() != digest
+        assert copied._digest() == ns._digest()
+
+    def test_reattached_child_invalidates_old_ancestors(self):
+        outer = Namespacify({'p': {'a': {'b': 1}}, 'c': 3})
+        ref = outer.deepcopy()
+        outer._digest()
+
+        q = Namespacify({})
+        q['a'] = outer['p']['a']
+        q['a']['b'] = 2
+
+        assert outer._digest() != ref._digest()
+        assert outer - ref == Namespacify({'p': {'a': {'b': 2}}})
+        assert outer.diff(ref) != []
+
+    def test_set_operations_skip_equal_subtrees(self):
+        from unittest import mock
+        from expfig import namespacify
+
+        a = Namespacify(NESTED_CONTENTS)
+        b = Namespacify(NESTED_CONTENTS)
+        b.truck.car = 'bing'
+
+        with mock.patch.object(namespacify, 'equal', wraps=namespacify.equal) as mock_equal:
+            assert (a - b) == Namespacify({'truck': {'car': 'skirt'}})
+            assert (a ^ b) == Namespacify({'truck': {'car': 'skirt'}})
+            assert (a & b) == Namespacify({'jeep': CONTENTS, 'truck': {'wheels': 18, 'axles': 6}})
+
+        assert all(not isinstance(args[0], Namespacify) for args, _ in mock_equal.call_args_list)
+
+
+class TestFlattenCache:
+    def test_cached(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        flat = ns.flatten()
+
+        assert ns._caches[('flatten', '.', None)] == flat
+        assert ns._caches['depth'] == ns.depth() == 2
+
+        flat['jeep.car'] = 'bing'
+        assert ns.flatten()['jeep.car'] == 'vroom'
+
+    def test_invalidated_on_mutation(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        ns.flatten(), ns.flatten(levels=-1), ns.flatten('/')
+
+        ns.truck['axles'] = {'front': {'width': 2}}
+
+        assert ns.depth() == 4
+        assert ns.flatten()['truck.axles.front.width'] == 2
+        assert ns.flatten('/')['truck/axles/front/width'] == 2
+        assert ns.flatten(levels=-1)['truck.axles.front'] == {'width': 2}
+
+        del ns.truck['axles']
+
+        assert ns.depth() == 2
+        assert 'truck.axles.front.width' not in ns.flatten()
+
+    def test_sibling_cache_kept(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        ns.flatten()
+        jeep_flat = ns.jeep.flatten()
+
+        ns.truck.car = 'bing'
+
+        assert ns._caches is None
+        assert ns.jeep._caches[('flatten', '.', None)] == jeep_flat
+
+    def test_shared_child_not_cached(self):
+        from copy import copy
+
+        ns = Namespacify(NESTED_CONTENTS)
+        copied = copy(ns)
+        copied.flatten()
+
+        ns.truck['axles'] = {'front': {'width': 2}}
+
+        assert copied.depth() == 4
+        assert copied.flatten()['truck.axles.front.width'] == 2
+
+    def test_invalidated_on_ior(self):
+        ns = Namespacify(NESTED_CONTENTS).index_paths()
+        truck = ns.truck
+        truck.flatten(), ns.flatten(), ns.depth()
+        digest = ns._digest()
+
+        truck |= {'axles': {'front': {'width': 2}}}
+
+        assert truck.flatten()['axles.front.width'] == 2
+        assert ns.flatten()['truck.axles.front.width'] == 2
+        assert ns.depth() == 4
+        assert ns._digest() != digest
+        assert ns['truck.axles.front.width'] == 2
+
+    def test_invalidated_through_second_parent(self):
+        ns = Namespacify(NESTED_CONTENTS)
+        ns.flatten(), ns.depth()
+
+        other = Namespacify({})
+        other['truck'] = ns.truck
+        other.truck['axles'] = {'front': {'width': 2}}
+
+        assert ns.depth() == other.depth() == 4
+        assert ns.flatten()['truck.axles.front.width'] == 2
+        assert other.flatten()['truck.axles.front.width'] == 2
@@ -1,6 +1,8 @@
+import argparse
+import numpy as np
 import pytest
 
-from expfig.core._parse import ListType, parse_arg_type
+from expfig.core._parse import ArrayType, ListType, element_representatives, parse_arg_type
 from expfig.core import str2none, str2bool, TypeToNone
 
 
@@ -50,6 +52,101 @@ class TestListTypeFromList:
         assert parsed == value
 
 
+    def test_mixed_empty_str(self):
+        with pytest.warns(UserWarning, match='Collecting list-like argument'):
+            list_type = ListType.from_list(['a', '', 'b'])
+
+        assert list_type.type == 'any'
+
+
+class TestElementRepresentatives:
+    def test_homogeneous(self):
+        assert element_representatives([0.5] * 1000) == [0.5]
+
+    def test_mixed(self):
+        list_like = ['a', '', None, 1, 2, [1, 'a'], [2], 'b', '']
+        assert element_representatives(list_like) == ['a', '', 1, [1, 'a'], [2]]
+
+
+class TestListTypeCall:
+    @pytest.mark.parametrize('value, expected', (
+        ([1, 2.5, True], [1.0, 2.5, 1.0]),
+        (['1.5', ' 2', '-3'], [1.5, 2.0, -3.0]),
+        ([1, None], [1.0, None]),
+        (['1', 'null'], [1.0, None]),
+    ))
+    def test_float(self, value, expected):
+        parsed = ListType.from_type(float)(value)
+
+        assert parsed == expected
+        assert all(type(v) is type(e) for v, e in zip(parsed, expected))
+
+    @pytest.mark.parametrize('value, expected', (
+        ([1, 2, True], [1, 2, 1]),
+        (['1', '-2'], [1, -2]),
+        ([2 ** 70], [2 ** 70]),
+        ([2 ** 63 - 1, 1], [2 ** 63 - 1, 1]),
+        ([2 ** 63], [2 ** 63]),
+        ([2 ** 64 - 1, 0], [2 ** 64 - 1, 0]),
+        ([-2 ** 63], [-2 ** 63]),
+        (['9223372036854775808'], [2 ** 63]),
+    ))
+    def test_int(self, value, expected):
+        parsed = ListType.from_type(int)(value)
+
+        assert parsed == expected
+        assert all(type(v) is int for v in parsed)
+
+    def test_int_to_none_at_int64_boundary(self):
+        assert ListType(TypeToNone(int))([2 ** 63]) == [2 ** 63]
+
+    @pytest.mark.parametrize('value', (['1.5'], ['a']))
+    def test_int_invalid(self, value):
+        with pytest.raises(ValueError):
+            ListType.from_type(int)(value)
+
+    def test_nested_list_invalid(self):
+        with pytest.raises(TypeError):
+            ListType.from_type(float)([[1.0], [2.0]])
+
+
+class TestArrayType:
+    def test_tokens(self):
+        parsed = ArrayType(np.float32, (2, 2))(['0.5', '1', '-2', '3e-1', '4', '5'])
+
+        assert parsed.dtype == np.float32
+        np.testing.assert_array_equal(parsed, np.array([[0.5, 1], [-2, 0.3], [4, 5]], dtype=np.float32))
+
+    def test_nested_list(self):
+        parsed = ArrayType(np.int64, (1, 2))([[1, 2], [3, 4]])
+        np.testing.assert_array_equal(parsed, [[1, 2], [3, 4]])
+
+    def test_literal(self):
+        parsed = ArrayType(np.float64, (3, ))('[1, 2]')
+        np.testing.assert_array_equal(parsed, [1.0, 2.0])
+
+    def test_npy_reference(self, tmp_path):
+        arr = np.arange(6.0).reshape(2, 3)
+        np.save(tmp_path / 'arr.npy', arr)
+
+        parsed = ArrayType(np.float64, (4, 3))([f'@{tmp_path / "arr.npy"}'])
+        np.testing.assert_array_equal(parsed, arr)
+
+    def test_none(self):
+        assert ArrayType(np.float64, (3, ))('null') is None
+
+    @pytest.mark.parametrize('value', (['1', '2', '3'], [0.5, 1.5], '@missing.npy'))
+    def test_invalid(self, value):
+        with pytest.raises(argparse.ArgumentTypeError):
+            ArrayType(np.int64, (2, 2))(value)
+
+    def test_parse_arg_type(self):
+        parsed_type, additional_args = parse_arg_type(np.zeros((3, 2), dtype=np.float32))
+
+        assert parsed_type == ArrayType(np.float32, (5, 2))
+        assert additional_args == {'nargs': '+'}
+
+
 class TestParseArgType:
     def test_str(self):
         parsed_type, _ = parse_arg_type('abc')
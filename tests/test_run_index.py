@@ -0,0 +1,109 @@
+import os
+import pytest
+
+from expfig import Config, Namespacify
+from expfig.functions import RunIndex
+
+
+DEFAULT = {
+    'optimizer': {'name': 'adam', 'lr': 1e-3},
+    'model': {'depth': 8, 'dropout': None, 'layers': [64, 64]},
+}
+
+
+def serialize_runs(root, *updates):
+    paths = []
+    for j, update in enumerate(updates):
+        config = Config(default=DEFAULT, config=update, argv=[])
+        config.serialize_to_dir(root / f'run_{j}')
+        paths.append(str((root / f'run_{j}' / 'config.yaml').resolve()))
+
+    return paths
+
+
+@pytest.fixture
+def runs(tmp_path):
+    root = tmp_path / 'logs'
+    paths = serialize_runs(
+        root,
+        {},
+        {'optimizer.lr': 3e-4, 'model.depth': 16},
+        {'optimizer.lr': 3e-4, 'model.depth': 4, 'optimizer.name': 'sgd'},
+    )
+    return root, paths
+
+
+@pytest.fixture
+def index(tmp_path, runs):
+    with RunIndex(tmp_path / 'index.sqlite') as index:
+        index.update(runs[0], workers=0)
+        yield index
+
+
+class TestRunIndex:
+    def test_indexed(self, index, runs):
+        assert index.paths() == runs[1]
+        assert len(index) == 3
+
+    def test_query_all(self, index, runs):
+        configs = index.query()
+
+        assert list(configs) == runs[1]
+        assert all(isinstance(c, Namespacify) for c in configs.values())
+        assert configs[runs[1][0]] == Namespacify(DEFAULT)
+
+    def test_query_equal_and_compare(self, index, runs):
+        configs = index.query({'optimizer.lr': 3e-4, 'model.depth': ('>', 12)})
+        assert list(configs) == [runs[1][1]]
+
+    def test_query_str_and_none(self, index, runs):
+        assert list(index.query({'optimizer.name': 'sgd'})) == [runs[1][2]]
+        assert list(index.query({'optimizer.name': ('!=', 'sgd')})) == runs[1][:2]
+        assert len(index.query({'model.dropout': None})) == 3
+
+    def test_query_large_int(self, tmp_path):
+        seed = 2 ** 53 + 1
+        paths = serialize_runs(tmp_path / 'seeds', {'seed': seed}, {'seed': seed - 1}, {'seed': 2 ** 64})
+
+        with RunIndex(':memory:') as index:
+            index.update(tmp_path / 'seeds')
+
+            assert list(index.query({'seed': seed})) == [paths[0]]
+            assert list(index.query({'seed': seed - 1})) == [paths[1]]
+            assert list(index.query({'seed': ('>', seed)})) == [paths[2]]
+            assert list(index.query({'seed': 1.0 * (seed - 1)})) == [paths[1]]
+
+    def test_query_frame(self, index, runs):
+        frame = index.query({'optimizer.lr': 3e-4}, as_frame=True)
+
+        assert list(frame.index) == runs[1][1:]
+        assert frame['model.depth'].tolist() == [16, 4]
+        assert frame['model.layers'].tolist() == [[64, 64], [64, 64]]
+
+    def test_invalid_query(self, index):
+        with pytest.raises(ValueError):
+            index.query({'model.depth': ('~', 12)})
+
+        with pytest.raises(TypeError):
+            index.query({'model.layers': [64, 64]})
+
+    def test_incremental_update(self, index, runs):
+        root, paths = runs
+        assert index.update(root, workers=0) == 0
+
+        stat = os.stat(paths[0])
+        Namespacify({**DEFAULT, 'model': {'depth': 32}}).serialize_to_dir(root / 'run_0', fname='config.yaml',
+                                                                          use_existing_dir=True)
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        os.remove(paths[2])
+
+        assert index.update(root, workers=0) == 1
+        assert index.paths() == paths[:2]
+        assert list(index.query({'model.depth': 32})) == [paths[0]]
+
+    def test_persistent(self, tmp_path, index, runs):
+        index.close()
+
+        with RunIndex(tmp_path / 'index.sqlite') as reopened:
+            assert reopened.paths() == runs[1]
+            assert reopened.update(runs[0], workers=0) == 0
@@ -0,0 +1,48 @@
+import pytest
+
+from difflib import get_close_matches
+
+from expfig.core.similar_args import SimilarArgsIndex, get_similar_args, get_similar_args_str_fmt
+from expfig.core._schema import ArgumentSchema
+
+
+KNOWN_ARGS = [
+    'truck.car', 'truck.wheels', 'truck.axles', 'jeep.car', 'jeep.wheels', 'jeep.axles', 'dealer', 'dealer.name',
+    'verbose'
+]
+
+
+class TestSimilarArgsIndex:
+    @pytest.mark.parametrize('word', ('truck.cat', 'jep.wheels', 'dealr', 'trucks', 'verbos', 'axles', 'zzz', ''))
+    def test_same_as_difflib(self, word):
+        index = SimilarArgsIndex(KNOWN_ARGS)
+        assert index.get_close_matches(word) == get_close_matches(word, KNOWN_ARGS)
+
+    def test_large(self):
+        known_args = [f'group_{j}.subgroup_{k}.value' for j in range(100) for k in range(100)]
+        index = SimilarArgsIndex(known_args)
+
+        assert index.get_close_matches('group_42.subgroup_17.valeu')[0] == 'group_42.subgroup_17.value'
+
+
+class TestGetSimilarArgs:
+    def test_results_scoped_to_call(self):
+        first = get_similar_args(['--truck.cat'], KNOWN_ARGS)
+        second = get_similar_args(['--jeep.whels'], KNOWN_ARGS)
+
+        assert list(first) == ['--truck.cat']
+        assert list(second) == ['--jeep.whels']
+        assert second['--jeep.whels'][0] == '--jeep.wheels'
+
+    def test_str_fmt_with_index(self):
+        index = SimilarArgsIndex(KNOWN_ARGS)
+        msg = get_similar_args_str_fmt(['--truck.cat', 'stray'], index)
+
+        assert "'--truck.cat' is not a recognized argument" in msg
+        assert '--truck.car' in msg
+
+    def test_schema_index_cached(self):
+        schema = ArgumentSchema.from_default({'truck': {'car': 'vroom', 'wheels': 4}})
+
+        assert schema.similar_args_index is schema.similar_args_index
+        assert sorted(schema.similar_args_index.known_args) == ['truck.car', 'truck.wheels', 'verbose']
@@ -1,7 +1,7 @@
 import pytest
 import yaml
 
-from expfig.core._parse_yaml_obj import YamlType
+from expfig.core._parse_yaml_obj import YamlType, _load_fragment
 from tests.helpers.yaml_obj import InsuranceA
 
 
@@ -25,3 +25,35 @@ class TestYamlType:
 
         with pytest.raises(yaml.YAMLError):
             _ = yaml_type('!MisspelledInsurance {value: 10}')
+
+
+class TestLoadFragment:
+    @pytest.mark.parametrize('value', (
+        '!InsuranceA {value: 10}',
+        '!InsuranceA{value: 10}',
+        '!InsuranceA{value:10}',
+    ))
+    def test_repaired(self, value):
+        loaded = YamlType(yaml_default=True)(value)
+        assert loaded == InsuranceA(value=10)
+
+    def test_tag_only(self):
+        loaded = YamlType(yaml_default=True)('!InsuranceA')
+
+        assert isinstance(loaded, InsuranceA)
+        assert loaded.__dict__ == {}
+
+    def test_scalar_tag_only(self):
+        assert YamlType(yaml_default=False)('!!str') == ''
+
+    def test_cached_fresh_copies(self):
+        _load_fragment.cache_clear()
+
+        first = YamlType(yaml_default=True)('!InsuranceA {value: [1, 2]}')
+        first.value.append(3)
+
+        second = YamlType(yaml_default=True)('!InsuranceA {value: [1, 2]}')
+
+        assert second is not first
+        assert second.value == [1, 2]
+        assert _load_fragment.cache_info().hits == 1